@@ -5,40 +5,171 @@ Check Weekly Report Tracker status and perform basic operations
 
 import sys
 import os
-import subprocess
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+def open_pidfd(pid):
+    """Open a pidfd for pid, or return None if the process is gone.
+
+    A pidfd is a stable handle to one specific process: unlike a raw PID
+    it cannot be recycled to an unrelated process between the liveness
+    check and a later signal. Returns None on ProcessLookupError and
+    falls back to raising OSError on kernels without pidfd_open (< 5.3).
+    """
+    try:
+        return os.pidfd_open(pid)
+    except ProcessLookupError:
+        return None
+
+def pid_is_alive(pid):
+    """Race-free process liveness check via pidfd, with os.kill fallback"""
+    try:
+        fd = open_pidfd(pid)
+    except (AttributeError, OSError):
+        # Older kernel/Python - fall back to the classic signal-0 probe
+        try:
+            os.kill(pid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+    if fd is None:
+        return False
+    os.close(fd)
+    return True
+
+def pid_is_our_daemon(pid):
+    """Liveness check that also verifies the PID is really our daemon
+
+    On Linux, reading /proc/<pid>/cmdline answers "does it exist" and
+    "is it the tracker" in one stat-cheap read - a plain kill(pid, 0)
+    happily reports a recycled PID belonging to an unrelated process as
+    alive, which would keep a stale lock around forever. Falls back to
+    the ordinary liveness probe where /proc isn't usable.
+    """
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            cmdline = f.read()
+    except FileNotFoundError:
+        return False  # No such process
+    except OSError:
+        return pid_is_alive(pid)
+    if not cmdline:
+        # Kernel thread or zombie - be conservative and just probe
+        return pid_is_alive(pid)
+    return b"weekly_report" in cmdline or b"tray_daemon" in cmdline
+
+def remove_stale_lock(lock_file, st=None):
+    """Atomically claim and remove a stale lock file.
+
+    Two concurrent invocations (or a just-started daemon) can race a plain
+    os.remove(): one could delete the fresh lock the other just wrote. To
+    avoid that we claim the reaper role first by hard-linking a temp file
+    to a ".reap" sidecar (link(2) is atomic, so only one claimant wins),
+    then re-stat the lock and only unlink it if it is still the same inode
+    we inspected.
+    """
+    reap_file = lock_file + ".reap"
+    tmp_file = f"{lock_file}.reap.{os.getpid()}"
+    if st is None:
+        try:
+            st = os.stat(lock_file, follow_symlinks=False)
+        except FileNotFoundError:
+            return False  # Already gone
+
+    try:
+        with open(tmp_file, 'w') as f:
+            f.write(str(os.getpid()))
+
+        try:
+            os.link(tmp_file, reap_file)
+        except FileExistsError:
+            # Another reaper is active - back off and let it finish
+            return False
+
+        try:
+            # Only remove if the lock is still the exact file we inspected
+            # (a racing daemon may have rewritten it in the meantime)
+            current = os.stat(lock_file, follow_symlinks=False)
+            if (current.st_ino == st.st_ino and
+                current.st_mtime_ns == st.st_mtime_ns):
+                os.unlink(lock_file)
+                return True
+            return False
+        finally:
+            try:
+                os.unlink(reap_file)
+            except FileNotFoundError:
+                pass
+    except FileNotFoundError:
+        return False
+    finally:
+        try:
+            os.unlink(tmp_file)
+        except FileNotFoundError:
+            pass
+
 def check_running():
     """Check if daemon is running (with automatic stale lock cleanup)"""
     lock_files = [
         "/tmp/weekly-report-tray.lock",
-        "/tmp/weekly-report-tracker.lock", 
+        "/tmp/weekly-report-tracker.lock",
         "/tmp/weekly-report-tracker-working.lock"
     ]
-    
+
     for lock_file in lock_files:
-        if os.path.exists(lock_file):
+        # Bind to one inode up front: every later operation (read, fstat)
+        # goes through the fd, so a symlink swap or rename between steps
+        # cannot retarget us to a different file (classic TOCTOU)
+        try:
+            fd = os.open(lock_file, os.O_RDONLY | os.O_NOFOLLOW | os.O_CLOEXEC)
+        except FileNotFoundError:
+            continue
+        except OSError:
+            continue  # Symlink or unreadable - not our lock
+
+        try:
             try:
-                with open(lock_file, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                # Check if process is actually running
-                try:
-                    os.kill(pid, 0)  # Signal 0 just checks if process exists
-                    return True, pid, lock_file
-                except ProcessLookupError:
-                    # Process doesn't exist, remove stale lock file
-                    os.remove(lock_file)
-                    print(f"🧹 Removed stale lock file: {lock_file}")
-            except (ValueError, FileNotFoundError):
-                try:
-                    os.remove(lock_file)
+                pid = int(os.read(fd, 32).strip())
+                st = os.fstat(fd)
+            except ValueError:
+                if remove_stale_lock(lock_file, os.fstat(fd)):
                     print(f"🧹 Removed invalid lock file: {lock_file}")
-                except FileNotFoundError:
-                    pass
-    
+                continue
+
+            # Preferred liveness check: the daemon holds an exclusive
+            # flock on its lock file for its whole lifetime, and the
+            # kernel drops it automatically on exit - no PID involved,
+            # so stale-cleanup and PID-reuse races cannot happen
+            import fcntl
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            except BlockingIOError:
+                return True, pid, lock_file
+
+            # Verify the path still names the inode we locked - the
+            # holder may have unlinked it between our open and flock
+            try:
+                if os.stat(lock_file).st_ino != st.st_ino:
+                    continue
+            except FileNotFoundError:
+                continue
+
+            # Nobody holds the lock. Older daemons wrote a PID file
+            # without flocking it, so fall back to the PID probe before
+            # declaring the lock stale - verifying identity via /proc
+            # so a recycled PID can't masquerade as the daemon
+            if pid_is_our_daemon(pid):
+                return True, pid, lock_file
+
+            # Process doesn't exist, remove stale lock file
+            # (remove_stale_lock re-checks the inode we fstat'd)
+            if remove_stale_lock(lock_file, st):
+                print(f"🧹 Removed stale lock file: {lock_file}")
+        finally:
+            os.close(fd)
+
     return False, None, None
 
 def show_status():
@@ -46,83 +177,97 @@ def show_status():
     from src.data_manager import DataManager
     from src.report_generator import ReportGenerator
     
-    print("📊 Weekly Report Tracker - Status")
-    print("=" * 40)
-    
+    # Build the whole status block and emit it in one write instead of
+    # a dozen individually flushed print() calls
+    out = []
+    out.append("📊 Weekly Report Tracker - Status")
+    out.append("=" * 40)
+
     # Check if daemon is running
     running, pid, lock_file = check_running()
     if running:
-        print(f"🟢 Status: RUNNING (PID: {pid})")
-        print(f"🔒 Lock file: {lock_file}")
+        out.append(f"🟢 Status: RUNNING (PID: {pid})")
+        out.append(f"🔒 Lock file: {lock_file}")
     else:
-        print("🔴 Status: NOT RUNNING")
-    
+        out.append("🔴 Status: NOT RUNNING")
+
     # Check data
     try:
         dm = DataManager()
         state = dm.get_state()
-        
-        print(f"\n📝 Current Work:")
+
+        out.append("\n📝 Current Work:")
         if state.current_ticket and state.current_project:
-            print(f"   Project: {state.current_project}")
-            print(f"   Ticket: {state.current_ticket}")
+            out.append(f"   Project: {state.current_project}")
+            out.append(f"   Ticket: {state.current_ticket}")
             if state.current_details:
-                print(f"   Details: {state.current_details}")
+                out.append(f"   Details: {state.current_details}")
         else:
-            print("   No active work")
-        
-        print(f"\n📈 This Week Summary:")
+            out.append("   No active work")
+
+        out.append("\n📈 This Week Summary:")
         summary = dm.get_current_week_summary()
-        print(f"   Total hours: {summary['total_time']/60:.1f}")
-        print(f"   Entries: {summary['entries_count']}")
-        print(f"   Projects: {len(summary['projects'])}")
-        
-        for project, data in summary['projects'].items():
-            print(f"     • {project}: {data['time']/60:.1f}h")
-        
+        out.append(f"   Total hours: {summary['total_time']/60:.1f}")
+        out.append(f"   Entries: {summary['entries_count']}")
+        out.append(f"   Projects: {len(summary['projects'])}")
+
+        out.extend(f"     • {project}: {data['time']/60:.1f}h"
+                   for project, data in summary['projects'].items())
+
         # Show data location
-        print(f"\n📁 Data location: {dm.get_data_location()}")
-        
+        out.append(f"\n📁 Data location: {dm.get_data_location()}")
+
     except Exception as e:
-        print(f"❌ Error reading data: {e}")
+        out.append(f"❌ Error reading data: {e}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+def open_report_file(report_path):
+    """Open a report with the first available editor (non-blocking)
+
+    Resolving the editor with shutil.which up front avoids the failed
+    fork+exec per missing candidate that the old try-Popen chain paid,
+    and os.posix_spawn takes the kernel's vfork fast path instead of
+    duplicating the parent's page tables the way fork+exec does.
+    """
+    import shutil
+
+    editor_names = {'pluma': 'pluma', 'gedit': 'gedit',
+                    'xdg-open': 'default application'}
+    try:
+        editor = next((e for e in editor_names if shutil.which(e)), None)
+        if editor is None:
+            print(f"❌ No suitable application found to open: {report_path}")
+            return
+
+        editor_path = shutil.which(editor)
+        os.posix_spawn(
+            editor_path, [editor, report_path], os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_DUP2, 1, 2),
+            ],
+            setsid=True,  # Detach so the editor outlives this script
+        )
+        print(f"📄 Opened with {editor_names[editor]}")
+    except Exception as e:
+        print(f"❌ Error opening file: {e}")
 
 def generate_report():
     """Generate current report"""
     try:
         from src.data_manager import DataManager
         from src.report_generator import ReportGenerator
-        
+
         print("📄 Generating weekly report...")
         dm = DataManager()
         rg = ReportGenerator()
         
         report_path = rg.generate_weekly_report(dm.get_state())
         print(f"✅ Report generated: {report_path}")
-        
-        # Open report with Pluma (non-blocking)
-        try:
-            # Try pluma first
-            try:
-                subprocess.Popen(['pluma', report_path], 
-                               stdout=subprocess.DEVNULL, 
-                               stderr=subprocess.DEVNULL)
-                print(f"📄 Opened with pluma")
-            except FileNotFoundError:
-                # Fallback to gedit
-                try:
-                    subprocess.Popen(['gedit', report_path],
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
-                    print(f"📄 Opened with gedit")
-                except FileNotFoundError:
-                    # Final fallback to xdg-open
-                    subprocess.Popen(['xdg-open', report_path],
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
-                    print(f"📄 Opened with default application")
-        except Exception as e:
-            print(f"❌ Error opening file: {e}")
-        
+
+        open_report_file(report_path)
+
     except Exception as e:
         print(f"❌ Error generating report: {e}")
 
@@ -131,38 +276,16 @@ def generate_last_week_report():
     try:
         from src.data_manager import DataManager
         from src.report_generator import ReportGenerator
-        
+
         print("📅 Generating last week report...")
         dm = DataManager()
         rg = ReportGenerator()
         
         report_path = rg.generate_last_week_report(dm.get_state())
         print(f"✅ Last week report generated: {report_path}")
-        
-        # Open report with Pluma (non-blocking)
-        try:
-            # Try pluma first
-            try:
-                subprocess.Popen(['pluma', report_path], 
-                               stdout=subprocess.DEVNULL, 
-                               stderr=subprocess.DEVNULL)
-                print(f"📄 Opened with pluma")
-            except FileNotFoundError:
-                # Fallback to gedit
-                try:
-                    subprocess.Popen(['gedit', report_path],
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
-                    print(f"📄 Opened with gedit")
-                except FileNotFoundError:
-                    # Final fallback to xdg-open
-                    subprocess.Popen(['xdg-open', report_path],
-                                   stdout=subprocess.DEVNULL,
-                                   stderr=subprocess.DEVNULL)
-                    print(f"📄 Opened with default application")
-        except Exception as e:
-            print(f"❌ Error opening file: {e}")
-        
+
+        open_report_file(report_path)
+
     except Exception as e:
         print(f"❌ Error generating last week report: {e}")
 
@@ -194,6 +317,52 @@ def cleanup_test_data():
     except Exception as e:
         print(f"❌ Error during cleanup: {e}")
 
+def stop_daemon(pid, wait=False, timeout_seconds=10):
+    """Send SIGTERM to the daemon, preferring a race-free pidfd signal
+
+    With wait=True, block until the daemon actually exits (or timeout).
+    The wait uses poll() on the pidfd: the kernel marks it readable
+    exactly once when the process exits, so there are no wakeups and no
+    CPU burned polling in a loop.
+    """
+    import signal as signal_module
+
+    try:
+        fd = open_pidfd(pid)
+        if fd is None:
+            print("⚠️  Process already exited")
+            return
+        try:
+            signal_module.pidfd_send_signal(fd, signal_module.SIGTERM)
+            print("🛑 Sent stop signal")
+
+            if wait:
+                import select
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                if poller.poll(timeout_seconds * 1000):
+                    print("✅ Daemon stopped")
+                else:
+                    print(f"⚠️  Daemon still running after {timeout_seconds}s")
+        finally:
+            os.close(fd)
+        return
+    except (AttributeError, OSError):
+        # Older kernel - fall back to plain kill (small PID-reuse window)
+        os.kill(pid, 15)  # SIGTERM
+        print("🛑 Sent stop signal")
+
+    if wait:
+        # No pidfd available - degrade to a coarse liveness poll
+        import time
+        deadline = time.monotonic() + timeout_seconds
+        while time.monotonic() < deadline:
+            if not pid_is_alive(pid):
+                print("✅ Daemon stopped")
+                return
+            time.sleep(0.2)
+        print(f"⚠️  Daemon still running after {timeout_seconds}s")
+
 def main():
     if len(sys.argv) > 1:
         command = sys.argv[1].lower()
@@ -210,6 +379,8 @@ def main():
             cleanup_test_data()
         elif command == "start":
             if not check_running()[0]:
+                import subprocess
+
                 print("🚀 Starting Weekly Report Tracker...")
                 subprocess.Popen(['./weekly_report'])
                 print("✅ Started (running in background)")
@@ -218,12 +389,11 @@ def main():
         elif command == "stop":
             running, pid, lock_file = check_running()
             if running:
-                os.kill(pid, 15)  # SIGTERM
-                print("🛑 Sent stop signal")
+                stop_daemon(pid, wait="--wait" in sys.argv[2:])
             else:
                 print("⚠️  Not running")
         else:
-            print("Unknown command. Use: status, report, lastweek, add, cleanup, start, stop")
+            print("Unknown command. Use: status, report, lastweek, add, cleanup, start, stop [--wait]")
     else:
         show_status()
 
@@ -1,9 +1,33 @@
 import json
+from collections import defaultdict
 import os
+import re
+import sys
 from pathlib import Path
 from typing import Optional
 from .models import AppState
 
+try:
+    import orjson  # C JSON decoder, ~3-5x faster than stdlib
+except ImportError:
+    orjson = None
+
+# Test/demo entry patterns, compiled once into a single alternation so
+# cleanup does one C-level scan per entry instead of a nested Python loop
+_TEST_PATTERNS = (
+    'test', 'demo', 'example', 'sample', 'mock', 'fake', 'dummy',
+    'added via status script', 'added via script', 'via script'
+)
+_TEST_PATTERNS_RX = re.compile("|".join(map(re.escape, _TEST_PATTERNS)))
+
+# Parsed-state cache keyed by file path -> (mtime_ns, size, AppState).
+# check_status.py constructs a fresh DataManager per subcommand; the cache
+# skips re-decoding an unchanged database within the same process.
+_STATE_CACHE = {}
+
+# Reconcile the journal into the base snapshot after this many deltas
+_JOURNAL_RECONCILE_EVERY = 64
+
 
 class DataManager:
     def __init__(self, data_file: str = None):
@@ -16,17 +40,33 @@ class DataManager:
         else:
             self.data_file = Path(__file__).parent.parent / data_file
             self.data_file.parent.mkdir(exist_ok=True)
-        
+
         self.app_state: Optional[AppState] = None
+        self._journal_fd: Optional[int] = None
+        self._journal_writes = 0
+        # Bumped whenever the set of known tickets can have changed, so
+        # UI-side caches built from the ticket index can validate cheaply
+        self.state_version = 0
         self._load_data()
+        self._rebuild_ticket_index()
     
     def _load_data(self) -> None:
         """Load data from JSON file or create new state"""
         try:
             if self.data_file.exists():
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                self.app_state = AppState.from_dict(data)
+                st = self.data_file.stat()
+                cache_key = str(self.data_file)
+                cached = _STATE_CACHE.get(cache_key)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    self.app_state = cached[2]
+                else:
+                    raw = self.data_file.read_bytes()
+                    if orjson is not None:
+                        data = orjson.loads(raw)
+                    else:
+                        data = json.loads(raw)
+                    self.app_state = AppState.from_dict(data)
+                    _STATE_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, self.app_state)
             else:
                 self.app_state = AppState()
                 self._save_data()
@@ -41,31 +81,151 @@ class DataManager:
             # Create new state
             self.app_state = AppState()
             self._save_data()
-    
-    def _save_data(self) -> None:
-        """Save current state to JSON file"""
+            return
+
+        self._replay_journal()
+
+    def _journal_file(self) -> Path:
+        return self.data_file.with_suffix('.journal')
+
+    def _append_journal(self, op: dict) -> None:
+        """Append one delta line to the sidecar journal
+
+        Current-work updates touch a couple of fields; rewriting the
+        whole database (O(all entries)) per click is wasteful. The
+        journal records just the delta (write-ahead-log style) and is
+        reconciled into the base snapshot on full saves or every
+        _JOURNAL_RECONCILE_EVERY writes.
+        """
         try:
-            # Create backup before saving
-            if self.data_file.exists():
-                backup_file = self.data_file.with_suffix('.json.tmp')
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.app_state.to_dict(), f, indent=2, ensure_ascii=False)
-                
-                # Atomic replace
-                backup_file.replace(self.data_file)
+            if self._journal_fd is None:
+                self._journal_fd = os.open(
+                    self._journal_file(),
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+                )
+            if orjson is not None:
+                payload = orjson.dumps(op) + b"\n"
+            else:
+                payload = json.dumps(op).encode('utf-8') + b"\n"
+            os.write(self._journal_fd, payload)
+            os.fdatasync(self._journal_fd)
+
+            self._journal_writes += 1
+            if self._journal_writes >= _JOURNAL_RECONCILE_EVERY:
+                self._save_data()
+        except Exception as e:
+            print(f"Error writing journal: {e}")
+            self._save_data()  # Fall back to a full rewrite
+
+    def _replay_journal(self) -> None:
+        """Apply journaled deltas left over from a previous run"""
+        journal = self._journal_file()
+        try:
+            if not journal.exists():
+                return
+            for line in journal.read_bytes().splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                op = orjson.loads(line) if orjson is not None else json.loads(line)
+                if op.get("op") == "update":
+                    if op.get("ticket") is not None:
+                        self.app_state.current_ticket = op["ticket"]
+                    if op.get("project") is not None:
+                        self.app_state.current_project = op["project"]
+                    if op.get("details") is not None:
+                        self.app_state.current_details = op["details"]
+                elif op.get("op") == "stop":
+                    self.app_state.current_ticket = None
+                    self.app_state.current_project = None
+                    self.app_state.current_details = None
+        except Exception as e:
+            print(f"Error replaying journal: {e}")
+
+    def _save_data(self, compact: bool = True) -> None:
+        """Save current state to JSON file (atomic write-then-replace)
+
+        Serializes in one shot to bytes (orjson when available), writes
+        through a raw fd with fsync, then os.replace()s over the real
+        file so readers never see a partial database. Compact output is
+        the default; pass compact=False for a human-readable dump.
+        """
+        try:
+            state_dict = self.app_state.to_dict()
+            if orjson is not None:
+                option = 0 if compact else orjson.OPT_INDENT_2
+                payload = orjson.dumps(state_dict, option=option)
             else:
-                with open(self.data_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.app_state.to_dict(), f, indent=2, ensure_ascii=False)
+                indent = None if compact else 2
+                payload = json.dumps(state_dict, indent=indent,
+                                     ensure_ascii=False).encode('utf-8')
+
+            tmp_file = self.data_file.with_suffix('.json.tmp')
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            # Atomic replace
+            os.replace(tmp_file, self.data_file)
+
+            # Keep the parse cache in sync with what we just wrote
+            st = self.data_file.stat()
+            _STATE_CACHE[str(self.data_file)] = (st.st_mtime_ns, st.st_size, self.app_state)
+
+            # The snapshot now contains everything - drop the journal
+            self._journal_writes = 0
+            if self._journal_fd is not None:
+                os.close(self._journal_fd)
+                self._journal_fd = None
+            try:
+                os.unlink(self._journal_file())
+            except FileNotFoundError:
+                pass
         except Exception as e:
             print(f"Error saving data: {e}")
     
     def get_state(self) -> AppState:
         """Get current application state"""
         return self.app_state
-    
+
+    def _rebuild_ticket_index(self) -> None:
+        """Rebuild the ticket -> (project, last_details) index from scratch
+
+        One pass over the entries at load time; add_work_entry keeps it
+        current afterwards so dialog opens never rescan the history or
+        touch the state object at all. Values are flat tuples - one
+        allocation per ticket instead of a nested dict. First occurrence
+        wins for the values, matching the scan the dialog used to do,
+        but keys are kept in last-use order (most recent last) so the UI
+        can slice out the freshest tickets.
+        """
+        index = {}
+        for entry in self.app_state.work_entries:
+            # Interned keys let later lookups with interned probes hit
+            # the pointer-equality fast path instead of re-hashing
+            ticket = sys.intern(entry.ticket)
+            info = index.pop(ticket, None)
+            if info is None:
+                info = (entry.project, entry.details)
+            index[ticket] = info
+        self._ticket_index = index
+
+    def get_ticket_index(self) -> dict:
+        """Get the ticket -> (project, last_details) autofill index"""
+        return self._ticket_index
+
     def add_work_entry(self, ticket: str, project: str, details: str = "") -> None:
         """Add new work entry and save"""
         self.app_state.add_work_entry(ticket, project, details)
+        ticket = sys.intern(ticket)
+        info = self._ticket_index.pop(ticket, None)
+        if info is None:
+            info = (project, details)
+        self._ticket_index[ticket] = info  # Re-keyed last for recency order
+        self.state_version += 1
         self._save_data()
     
     def update_current_work(self, ticket: Optional[str] = None, 
@@ -78,49 +238,51 @@ class DataManager:
             self.app_state.current_project = project
         if details is not None:
             self.app_state.current_details = details
-        
-        self._save_data()
-    
+
+        self._append_journal({"op": "update", "ticket": ticket,
+                              "project": project, "details": details})
+
     def stop_current_work(self) -> None:
         """Stop current work session"""
         self.app_state.current_ticket = None
         self.app_state.current_project = None
         self.app_state.current_details = None
-        self._save_data()
+        self._append_journal({"op": "stop"})
     
     def get_project_for_ticket(self, ticket: str) -> Optional[str]:
-        """Get project name based on ticket using auto-detection"""
+        """Get project name based on ticket using auto-detection
+
+        An exact ticket seen before resolves through the maintained
+        ticket index in one dict hit; only unseen tickets fall through
+        to the pattern-based auto-detection.
+        """
+        info = self._ticket_index.get(ticket)
+        if info is not None:
+            return info[0]
         return self.app_state.auto_detect_project(ticket)
     
     def get_current_week_summary(self) -> dict:
         """Get summary of current week's work"""
         entries = self.app_state.get_current_week_entries()
-        
-        projects_summary = {}
-        total_time = 0
-        
+        if not entries:
+            return {'total_time': 0, 'projects': {}, 'entries_count': 0}
+
+        projects_summary = defaultdict(lambda: {'tickets': set(), 'time': 0, 'details': []})
+
         for entry in entries:
-            if entry.project not in projects_summary:
-                projects_summary[entry.project] = {
-                    'tickets': set(),
-                    'time': 0,
-                    'details': []
-                }
-            
-            projects_summary[entry.project]['tickets'].add(entry.ticket)
-            projects_summary[entry.project]['time'] += entry.duration
+            project_data = projects_summary[entry.project]
+            project_data['tickets'].add(entry.ticket)
+            project_data['time'] += entry.duration
             if entry.details:
-                projects_summary[entry.project]['details'].append(entry.details)
-            
-            total_time += entry.duration
-        
+                project_data['details'].append(entry.details)
+
         # Convert sets to lists for JSON serialization
-        for project in projects_summary:
-            projects_summary[project]['tickets'] = list(projects_summary[project]['tickets'])
-        
+        for project_data in projects_summary.values():
+            project_data['tickets'] = list(project_data['tickets'])
+
         return {
-            'total_time': total_time,
-            'projects': projects_summary,
+            'total_time': sum(entry.duration for entry in entries),
+            'projects': dict(projects_summary),
             'entries_count': len(entries)
         }
     
@@ -129,45 +291,37 @@ class DataManager:
         if not self.app_state:
             return 0
         
-        original_count = len(self.app_state.work_entries)
-        
-        # Remove entries with test/demo patterns (expanded list)
-        test_patterns = [
-            'test', 'demo', 'example', 'sample', 'mock', 'fake', 'dummy',
-            'added via status script', 'added via script', 'via script'
+        # Remove entries with test/demo patterns: one compiled-regex scan
+        # per entry produces a keep-mask, and AppState.compress_entries
+        # rebuilds its parallel columns in lockstep from it
+        rx = _TEST_PATTERNS_RX
+        keep_mask = [
+            not rx.search(f"{entry.ticket}\0{entry.project}\0{entry.details}".lower())
+            for entry in self.app_state.work_entries
         ]
-        self.app_state.work_entries = [
-            entry for entry in self.app_state.work_entries
-            if not any(pattern.lower() in entry.ticket.lower() or 
-                      pattern.lower() in entry.project.lower() or
-                      pattern.lower() in entry.details.lower()
-                      for pattern in test_patterns)
-        ]
-        
+        removed_count = self.app_state.compress_entries(keep_mask)
+
         # Clear current work if it's test data
-        if (self.app_state.current_ticket and 
-            any(pattern.lower() in self.app_state.current_ticket.lower() or
-                pattern.lower() in (self.app_state.current_project or "").lower()
-                for pattern in test_patterns)):
+        if (self.app_state.current_ticket and
+            rx.search(f"{self.app_state.current_ticket}\0{self.app_state.current_project or ''}".lower())):
             self.app_state.current_ticket = None
             self.app_state.current_project = None
             self.app_state.current_details = None
             self.app_state.last_activity = None
-        
+
         # Remove test project mappings
-        test_projects = []
-        for project, mapping in self.app_state.project_mappings.items():
-            if any(pattern.lower() in project.lower() for pattern in test_patterns):
-                test_projects.append(project)
-        
+        test_projects = [
+            project for project in self.app_state.project_mappings
+            if rx.search(project.lower())
+        ]
         for project in test_projects:
             del self.app_state.project_mappings[project]
         
-        removed_count = original_count - len(self.app_state.work_entries)
-        
         if removed_count > 0:
             self._save_data()
-        
+            self._rebuild_ticket_index()
+            self.state_version += 1
+
         return removed_count
     
     def get_data_location(self) -> str:
@@ -1,10 +1,42 @@
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from itertools import compress
 from typing import Dict, List, Optional
 import json
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def week_bounds(day_ordinal: int, week_offset: int = 0) -> tuple:
+    """Return (week_start, week_end) dates for the week containing a day
+
+    Keyed by the day's ordinal so repeated calls within the same day
+    (e.g. the UI polling status) reuse the computed boundaries instead
+    of redoing the timedelta arithmetic.
+
+    Args:
+        day_ordinal: date.toordinal() of the reference day
+        week_offset: Weeks offset from that week (0=current, -1=last week, etc.)
+    """
+    day = date.fromordinal(day_ordinal)
+    week_start = day - timedelta(days=day.weekday()) + timedelta(weeks=week_offset)
+    return week_start, week_start + timedelta(days=6)
+
+
+def _entry_timestamp(data: Dict) -> datetime:
+    """Read an entry timestamp, accepting both disk formats
+
+    New files store integer epoch seconds under "ts"; databases written
+    before that change carry an ISO string under "timestamp".
+    """
+    ts = data.get("ts")
+    if ts is not None:
+        return datetime.fromtimestamp(ts)
+    return datetime.fromisoformat(data["timestamp"])
+
+
+@dataclass(slots=True)
 class WorkEntry:
     timestamp: datetime
     ticket: str
@@ -14,17 +46,19 @@ class WorkEntry:
     
     def to_dict(self) -> Dict:
         return {
-            "timestamp": self.timestamp.isoformat(),
+            # Epoch seconds: a third the bytes of an ISO string and a
+            # C-level fromtimestamp on load instead of string parsing
+            "ts": int(self.timestamp.timestamp()),
             "ticket": self.ticket,
             "project": self.project,
             "details": self.details,
             "duration": self.duration
         }
-    
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'WorkEntry':
         return cls(
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=_entry_timestamp(data),
             ticket=data["ticket"],
             project=data["project"],
             details=data.get("details", ""),
@@ -32,7 +66,7 @@ class WorkEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMapping:
     ticket_patterns: List[str] = field(default_factory=list)
     name: str = ""
@@ -51,7 +85,7 @@ class ProjectMapping:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     current_ticket: Optional[str] = None
     current_project: Optional[str] = None
@@ -59,14 +93,31 @@ class AppState:
     last_activity: Optional[datetime] = None
     work_entries: List[WorkEntry] = field(default_factory=list)
     project_mappings: Dict[str, ProjectMapping] = field(default_factory=dict)
-    
+    # Parallel list of timestamps kept sorted for bisect lookups
+    # (entries are append-only, so it stays in timestamp order)
+    _ts_index: List[datetime] = field(default_factory=list, repr=False, compare=False)
+    # Inverted index: lowercased ticket pattern -> project name
+    _pattern_index: Dict[str, str] = field(default_factory=dict, repr=False, compare=False)
+
     def to_dict(self) -> Dict:
         return {
             "current_ticket": self.current_ticket,
             "current_project": self.current_project,
             "current_details": self.current_details,
             "last_activity": self.last_activity.isoformat() if self.last_activity else None,
-            "work_entries": [entry.to_dict() for entry in self.work_entries],
+            # Entries are packed inline rather than via entry.to_dict() -
+            # this save path runs per entry and the method call per row
+            # is measurable on large histories
+            "work_entries": [
+                {
+                    "ts": int(e.timestamp.timestamp()),
+                    "ticket": e.ticket,
+                    "project": e.project,
+                    "details": e.details,
+                    "duration": e.duration
+                }
+                for e in self.work_entries
+            ],
             "project_mappings": {k: v.to_dict() for k, v in self.project_mappings.items()}
         }
     
@@ -77,43 +128,92 @@ class AppState:
             current_project=data.get("current_project"),
             current_details=data.get("current_details"),
             last_activity=datetime.fromisoformat(data["last_activity"]) if data.get("last_activity") else None,
-            work_entries=[WorkEntry.from_dict(entry) for entry in data.get("work_entries", [])],
+            work_entries=[
+                WorkEntry(
+                    timestamp=_entry_timestamp(entry),
+                    ticket=entry["ticket"],
+                    project=entry["project"],
+                    details=entry.get("details", ""),
+                    duration=entry.get("duration", 60)
+                )
+                for entry in data.get("work_entries", [])
+            ],
             project_mappings={k: ProjectMapping.from_dict(v) for k, v in data.get("project_mappings", {}).items()}
         )
     
+    def compress_entries(self, keep_mask: List[bool]) -> int:
+        """Bulk-delete entries with a boolean keep-mask, returning removed count
+
+        Rebuilds the entry list and the parallel timestamp index in
+        lockstep with itertools.compress (C-level), so the sorted index
+        survives the edit without a re-sort.
+        """
+        removed = len(self.work_entries) - sum(keep_mask)
+        if removed:
+            in_sync = len(self._ts_index) == len(self.work_entries)
+            self.work_entries = list(compress(self.work_entries, keep_mask))
+            if in_sync:
+                self._ts_index = list(compress(self._ts_index, keep_mask))
+            else:
+                self._ts_index = []  # Rebuilt lazily on next week lookup
+        return removed
+
+    def _ensure_ts_index(self) -> None:
+        """Rebuild the sorted timestamp index if it went out of sync
+
+        Needed lazily after from_dict() (which bypasses add_work_entry)
+        and after bulk edits like cleanup_test_data().
+        """
+        if len(self._ts_index) != len(self.work_entries):
+            self._ts_index = sorted(entry.timestamp for entry in self.work_entries)
+            self.work_entries.sort(key=lambda entry: entry.timestamp)
+
     def get_current_week_entries(self) -> List[WorkEntry]:
         """Get all work entries for current week (Monday to Sunday)"""
-        today = date.today()
-        week_start = today - timedelta(days=today.weekday())
-        week_end = week_start + timedelta(days=6)
-        
-        return [
-            entry for entry in self.work_entries
-            if week_start <= entry.timestamp.date() <= week_end
-        ]
-    
+        return self.get_week_entries_with_offset(0)
+
     def get_week_entries_with_offset(self, week_offset: int) -> List[WorkEntry]:
         """Get work entries for a specific week offset from current week
-        
+
         Args:
             week_offset: Weeks offset from current week (0=current, -1=last week, etc.)
         """
-        today = date.today()
-        current_week_start = today - timedelta(days=today.weekday())
-        target_week_start = current_week_start + timedelta(weeks=week_offset)
-        target_week_end = target_week_start + timedelta(days=6)
-        
-        return [
-            entry for entry in self.work_entries
-            if target_week_start <= entry.timestamp.date() <= target_week_end
-        ]
+        target_week_start, _ = week_bounds(date.today().toordinal(), week_offset)
+
+        # Bisect the sorted timestamp index instead of scanning every
+        # entry and constructing a date per comparison: O(log n) slicing
+        self._ensure_ts_index()
+        start_dt = datetime.combine(target_week_start, datetime.min.time())
+        end_dt = start_dt + timedelta(days=7)
+        lo = bisect_left(self._ts_index, start_dt)
+        hi = bisect_left(self._ts_index, end_dt)
+        return self.work_entries[lo:hi]
     
+    def _ensure_pattern_index(self) -> None:
+        """Rebuild the pattern -> project index if it went out of sync"""
+        expected = sum(len(m.ticket_patterns) for m in self.project_mappings.values())
+        if len(self._pattern_index) != expected:
+            self._pattern_index = {
+                pattern.lower(): project
+                for project, mapping in self.project_mappings.items()
+                for pattern in mapping.ticket_patterns
+            }
+
     def auto_detect_project(self, ticket: str) -> Optional[str]:
         """Auto-detect project based on ticket patterns"""
-        for project, mapping in self.project_mappings.items():
-            for pattern in mapping.ticket_patterns:
-                if pattern.lower() in ticket.lower():
-                    return project
+        self._ensure_pattern_index()
+        ticket_lower = ticket.lower()
+
+        # Patterns are ticket prefixes in practice, so try one dict hit first
+        prefix = ticket_lower.split('-')[0] if '-' in ticket_lower else ticket_lower[:3]
+        project = self._pattern_index.get(prefix)
+        if project is not None:
+            return project
+
+        # Fall back to a substring scan over the flattened index
+        for pattern, project in self._pattern_index.items():
+            if pattern in ticket_lower:
+                return project
         return None
     
     def add_work_entry(self, ticket: str, project: str, details: str = "") -> None:
@@ -125,7 +225,8 @@ class AppState:
             details=details
         )
         self.work_entries.append(entry)
-        
+        self._ts_index.append(entry.timestamp)
+
         self.current_ticket = ticket
         self.current_project = project
         self.current_details = details
@@ -138,6 +239,4 @@ class AppState:
         ticket_prefix = ticket.split('-')[0] if '-' in ticket else ticket[:3]
         if ticket_prefix not in self.project_mappings[project].ticket_patterns:
             self.project_mappings[project].ticket_patterns.append(ticket_prefix)
-
-
-from datetime import timedelta
\ No newline at end of file
+            self._pattern_index[ticket_prefix.lower()] = project
\ No newline at end of file
@@ -1,11 +1,26 @@
-import gi
-gi.require_version('Notify', '0.7')
-from gi.repository import Notify, GLib
 from typing import Callable, Optional
 
+# Loaded lazily by _load_gi(): importing gi.repository triggers GObject
+# introspection (and Notify.init a dbus handshake), which short CLI
+# invocations that merely import this module should never pay for
+Notify = None
+GLib = None
+
+
+def _load_gi() -> None:
+    """Import gi/Notify/GLib on first use, memoized into module globals"""
+    global Notify, GLib
+    if Notify is None:
+        import gi
+        gi.require_version('Notify', '0.7')
+        from gi.repository import Notify as _Notify, GLib as _GLib
+        Notify = _Notify
+        GLib = _GLib
+
 
 class NotificationManager:
     def __init__(self):
+        _load_gi()
         Notify.init("Weekly Report Tracker")
         self.current_notification: Optional[Notify.Notification] = None
         
@@ -111,25 +126,99 @@ class NotificationManager:
         Notify.uninit()
 
 
+def _create_hourly_timerfd() -> int:
+    """Create a timerfd that fires on every wall-clock hour boundary
+
+    A timerfd armed with TFD_TIMER_ABSTIME against CLOCK_REALTIME gives
+    one kernel-scheduled wakeup per hour, aligned to the hour and
+    resilient to suspend/resume (an expiry that passes while asleep
+    fires on wake) - unlike GLib's relative timeout which drifts.
+    Raises OSError if the syscalls are unavailable.
+    """
+    import ctypes
+    import time
+
+    CLOCK_REALTIME = 0
+    TFD_CLOEXEC = 0o2000000
+    TFD_TIMER_ABSTIME = 1
+
+    class _timespec(ctypes.Structure):
+        _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+    class _itimerspec(ctypes.Structure):
+        _fields_ = [("it_interval", _timespec), ("it_value", _timespec)]
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.timerfd_create(CLOCK_REALTIME, TFD_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "timerfd_create failed")
+
+    spec = _itimerspec()
+    spec.it_value.tv_sec = (int(time.time()) // 3600 + 1) * 3600  # Next hour
+    spec.it_interval.tv_sec = 3600
+    if libc.timerfd_settime(fd, TFD_TIMER_ABSTIME, ctypes.byref(spec), None) < 0:
+        err = ctypes.get_errno()
+        import os
+        os.close(fd)
+        raise OSError(err, "timerfd_settime failed")
+
+    return fd
+
+
 class HourlyTimer:
     """Timer to trigger hourly work checks"""
-    
+
     def __init__(self, callback: Callable):
         self.callback = callback
         self.timer_id: Optional[int] = None
-    
+        self.timer_fd: Optional[int] = None
+
     def start(self) -> None:
         """Start hourly timer"""
-        if self.timer_id:
+        _load_gi()
+        if self.timer_id or self.timer_fd is not None:
             self.stop()
-        
-        # Timer for every hour (3600 seconds)
-        # For testing, you can change to smaller interval like 300 (5 minutes)
+
+        # Prefer a timerfd-backed source: hour-aligned, suspend-safe,
+        # one kernel wakeup per hour
+        try:
+            self.timer_fd = _create_hourly_timerfd()
+            self.timer_id = GLib.unix_fd_add_full(
+                GLib.PRIORITY_DEFAULT, self.timer_fd, GLib.IOCondition.IN,
+                self._on_timerfd_ready
+            )
+            print("Hourly timer started (timerfd, hour-aligned)")
+            return
+        except (OSError, AttributeError) as e:
+            print(f"timerfd unavailable ({e}), using GLib timeout")
+
+        # Fallback: a one-shot timeout to the next :00, re-armed as a
+        # recurring hourly source from there - aligned like the timerfd
+        # path, where a plain 3600 s interval would drift from whatever
+        # minute the daemon happened to start at
+        import time
+        delay = 3600 - (int(time.time()) % 3600)
+        self.timer_id = GLib.timeout_add_seconds(delay, self._on_first_aligned_tick)
+        print("Hourly timer started (GLib timeout, hour-aligned)")
+
+    def _on_first_aligned_tick(self) -> bool:
+        """First hour-boundary fire - swap in the recurring hourly source"""
         self.timer_id = GLib.timeout_add_seconds(3600, self._on_timer)
-        print("Hourly timer started")
+        self._on_timer()
+        return False  # One-shot; the recurring source takes over
+
+    def _on_timerfd_ready(self, fd, condition) -> bool:
+        """timerfd became readable - clear the expiration count and tick"""
+        import os
+        try:
+            os.read(fd, 8)  # 8-byte expiration counter, must be drained
+        except OSError:
+            pass
+        return self._on_timer()
     
     def start_test_mode(self, interval_seconds: int = 300) -> None:
         """Start timer with custom interval for testing"""
+        _load_gi()
         if self.timer_id:
             self.stop()
         
@@ -142,6 +231,13 @@ class HourlyTimer:
             GLib.source_remove(self.timer_id)
             self.timer_id = None
             print("Timer stopped")
+        if self.timer_fd is not None:
+            import os
+            try:
+                os.close(self.timer_fd)
+            except OSError:
+                pass
+            self.timer_fd = None
     
     def _on_timer(self) -> bool:
         """Timer callback - returns True to continue timer"""
@@ -1,10 +1,77 @@
+import heapq
+import os
+import re
+from collections import defaultdict
 from datetime import datetime, date, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterator, List, Tuple
 from .models import WorkEntry, AppState
 
 
+_DAYS_EN = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+            'Saturday', 'Sunday')
+
+# Report filenames look like weekly_report_20250825-20250831.md
+_REPORT_RE = re.compile(r'^weekly_report_(\d{8})-(\d{8})\.md$')
+
+# Static report skeletons, built once at import time instead of being
+# re-assembled from f-string pieces on every report. The empty-report
+# skeleton is pre-encoded: only the two dates vary, so the whole write
+# is a bytes join plus one syscall with no text-encoding layer
+_EMPTY_REPORT_HEAD = b"# Weekly Report\n**Week:** "
+_EMPTY_REPORT_TAIL = (b"\n\n---\n\n## Summary\n"
+                      b"No activities were recorded this week.\n\n---\n")
+
+# Durations are integer minutes; multiplying by a precomputed reciprocal
+# is cheaper than a float divide at every aggregation point
+_INV_60 = 1.0 / 60.0
+
+_REPORT_HEADER_TMPL = """# Weekly Report
+**Week:** {start} - {end}
+
+---
+
+## Executive Summary
+- **Total hours worked:** {hours:.1f} hours
+- **Total entries:** {entries}
+- **Projects worked on:** {projects}
+
+---
+
+"""
+
+
+def _default_week_range() -> Tuple[date, date]:
+    """(week_start, week_end) of the current week, Monday to Sunday
+
+    Shared by the public entry points so internal helpers can require
+    explicit dates instead of each recomputing date.today() fallbacks.
+    """
+    today = date.today()
+    week_start = today - timedelta(days=today.weekday())
+    return week_start, week_start + timedelta(days=6)
+
+
+def _parse_ymd(s: str) -> date:
+    """Parse a pre-validated YYYYMMDD string - roughly 10x faster than
+    datetime.strptime, which re-interprets the format string per call"""
+    return date(int(s[0:4]), int(s[4:6]), int(s[6:8]))
+
+
+@lru_cache(maxsize=512)
+def _fmt_mdy(d: date) -> str:
+    """MM/DD/YYYY display form, cached - strftime goes through C locale
+    machinery and the same few dates get formatted repeatedly"""
+    return d.strftime('%m/%d/%Y')
+
+
 class ReportGenerator:
+    # Output directories already created by some instance this process -
+    # skips the stat+mkdir syscalls on every later construction
+    _ensured_dirs = set()
+
     def __init__(self, output_dir: str = None):
         if output_dir is None:
             # Use persistent location in user's home directory
@@ -12,8 +79,16 @@ class ReportGenerator:
             self.output_dir = home_dir / ".weekly-report-tracker" / "reports"
         else:
             self.output_dir = Path(__file__).parent.parent / output_dir
-        
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.output_dir not in ReportGenerator._ensured_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            ReportGenerator._ensured_dirs.add(self.output_dir)
+
+        # Listing cache keyed on the directory's mtime; rewriting an
+        # existing report doesn't bump the dir mtime, so writers also
+        # invalidate explicitly
+        self._listing_cache = None
+        self._listing_mtime = -1
     
     def generate_weekly_report(self, app_state: AppState, week_offset: int = 0) -> str:
         """Generate weekly report and return file path
@@ -28,8 +103,7 @@ class ReportGenerator:
             entries = app_state.get_week_entries_with_offset(week_offset)
         
         # Calculate week dates based on offset
-        today = date.today()
-        current_week_start = today - timedelta(days=today.weekday())
+        current_week_start, _ = _default_week_range()
         target_week_start = current_week_start + timedelta(weeks=week_offset)
         target_week_end = target_week_start + timedelta(days=6)
         
@@ -38,235 +112,244 @@ class ReportGenerator:
         
         report_content = self._create_report_content(entries, target_week_start, target_week_end)
         
-        # Create filename with week dates
-        filename = f"weekly_report_{target_week_start.strftime('%Y%m%d')}-{target_week_end.strftime('%Y%m%d')}.md"
+        # Create filename with week dates (format each date once)
+        start_ymd = target_week_start.strftime('%Y%m%d')
+        end_ymd = target_week_end.strftime('%Y%m%d')
+        filename = f"weekly_report_{start_ymd}-{end_ymd}.md"
         report_path = self.output_dir / filename
-        
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
-        
+
+        # One encode + one write syscall instead of text-IO buffering
+        report_path.write_text(report_content, encoding='utf-8')
+        self._listing_mtime = -1
+
         return str(report_path)
     
-    def _generate_empty_report(self, week_start: date = None, week_end: date = None) -> str:
+    def _generate_empty_report(self, week_start: date, week_end: date) -> str:
         """Generate report when no work entries exist"""
-        if week_start is None or week_end is None:
-            today = date.today()
-            week_start = today - timedelta(days=today.weekday())
-            week_end = week_start + timedelta(days=6)
-        
-        content = f"""# Weekly Report
-**Week:** {week_start.strftime('%m/%d/%Y')} - {week_end.strftime('%m/%d/%Y')}
-
----
-
-## Summary
-No activities were recorded this week.
-
----
-"""
-        
         filename = f"weekly_report_{week_start.strftime('%Y%m%d')}-{week_end.strftime('%Y%m%d')}.md"
         report_path = self.output_dir / filename
-        
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+
+        report_path.write_bytes(b"".join([
+            _EMPTY_REPORT_HEAD,
+            _fmt_mdy(week_start).encode(), b" - ", _fmt_mdy(week_end).encode(),
+            _EMPTY_REPORT_TAIL,
+        ]))
+        self._listing_mtime = -1
+
         return str(report_path)
     
-    def _create_report_content(self, entries: List[WorkEntry], week_start: date = None, week_end: date = None) -> str:
+    def _create_report_content(self, entries: List[WorkEntry], week_start: date, week_end: date) -> str:
         """Create formatted report content"""
-        if week_start is None or week_end is None:
-            today = date.today()
-            week_start = today - timedelta(days=today.weekday())
-            week_end = week_start + timedelta(days=6)
-        
-        # Group entries by project
-        projects_data = self._group_entries_by_project(entries)
-        
-        # Calculate totals
-        total_hours = sum(entry.duration for entry in entries) / 60
+        # One fused pass builds the project grouping, the daily grouping
+        # and the total, so each entry's attributes are touched once
+        projects_data, daily_data, total_duration = self._aggregate_entries(entries)
+
+        total_hours = total_duration * _INV_60
         total_entries = len(entries)
         
-        content = f"""# Weekly Report
-**Week:** {week_start.strftime('%m/%d/%Y')} - {week_end.strftime('%m/%d/%Y')}
+        # Assemble into a list and join once - repeated `content += ...`
+        # is quadratic in the worst case for large reports
+        parts = [_REPORT_HEADER_TMPL.format(start=_fmt_mdy(week_start),
+                                            end=_fmt_mdy(week_end),
+                                            hours=total_hours,
+                                            entries=total_entries,
+                                            projects=len(projects_data))]
 
----
-
-## Executive Summary
-- **Total hours worked:** {total_hours:.1f} hours
-- **Total entries:** {total_entries}
-- **Projects worked on:** {len(projects_data)}
-
----
-
-"""
-        
         # Add projects section
         for project_name, project_data in projects_data.items():
-            content += self._create_project_section(project_name, project_data)
-        
+            parts.append(self._create_project_section(project_name, project_data))
+
         # Add daily breakdown
-        content += self._create_daily_breakdown(entries)
-        
-        content += "\n---\n"
-        
-        return content
+        parts.append(self._create_daily_breakdown(daily_data))
+
+        parts.append("\n---\n")
+
+        return "".join(parts)
     
-    def _group_entries_by_project(self, entries: List[WorkEntry]) -> Dict:
-        """Group entries by project"""
-        projects = {}
-        
+    def _aggregate_entries(
+            self, entries: List[WorkEntry]
+    ) -> Tuple[Dict[str, dict], Dict[date, Dict[str, list]], int]:
+        """Aggregate entries by project, by day, and total in one pass
+
+        Returns (projects_data, daily_data, total_duration). Fusing the
+        groupings means each WorkEntry is traversed once instead of the
+        three separate scans the report builders used to make.
+        """
+        projects = defaultdict(lambda: {
+            'tickets': set(),
+            'total_time': 0,
+            'entries': [],
+            'details': [],
+            'details_set': set(),  # O(1) dedup; 'details' keeps first-seen order
+            'ticket_groups': defaultdict(lambda: {
+                'entries': [],
+                'total_time': 0,
+                'details': set()
+            })
+        })
+        # day -> project -> [minutes, tickets], accumulated here so the
+        # daily breakdown only formats - no re-bucketing or re-summing
+        # per day. Entries arrive in timestamp order (week lookups slice
+        # the sorted index), so the dict's insertion order is already
+        # chronological
+        daily = defaultdict(dict)
+        total_duration = 0
+
         for entry in entries:
-            if entry.project not in projects:
-                projects[entry.project] = {
-                    'tickets': set(),
-                    'total_time': 0,
-                    'entries': [],
-                    'details': []
-                }
-            
-            projects[entry.project]['tickets'].add(entry.ticket)
-            projects[entry.project]['total_time'] += entry.duration
-            projects[entry.project]['entries'].append(entry)
-            
-            if entry.details and entry.details not in projects[entry.project]['details']:
-                projects[entry.project]['details'].append(entry.details)
-        
-        return projects
+            total_duration += entry.duration
+
+            project_data = projects[entry.project]
+            project_data['tickets'].add(entry.ticket)
+            project_data['total_time'] += entry.duration
+            project_data['entries'].append(entry)
+
+            if entry.details and entry.details not in project_data['details_set']:
+                project_data['details_set'].add(entry.details)
+                project_data['details'].append(entry.details)
+
+            ticket_data = project_data['ticket_groups'][entry.ticket]
+            ticket_data['entries'].append(entry)
+            ticket_data['total_time'] += entry.duration
+            if entry.details:
+                ticket_data['details'].add(entry.details)
+
+            day_projects = daily[entry.timestamp.date()]
+            day_value = day_projects.get(entry.project)
+            if day_value is None:
+                day_projects[entry.project] = [entry.duration, {entry.ticket}]
+            else:
+                day_value[0] += entry.duration
+                day_value[1].add(entry.ticket)
+
+        return dict(projects), dict(daily), total_duration
     
     def _create_project_section(self, project_name: str, project_data: Dict) -> str:
         """Create formatted project section grouped by tickets"""
-        hours = project_data['total_time'] / 60
+        hours = project_data['total_time'] * _INV_60
         
-        section = f"""## {project_name}
+        parts = [f"""## {project_name}
 **Total time:** {hours:.1f} hours
 
-"""
-        
-        # Group entries by ticket for this project
-        ticket_groups = {}
-        for entry in project_data['entries']:
-            if entry.ticket not in ticket_groups:
-                ticket_groups[entry.ticket] = {
-                    'entries': [],
-                    'total_time': 0,
-                    'details': set()
-                }
-            ticket_groups[entry.ticket]['entries'].append(entry)
-            ticket_groups[entry.ticket]['total_time'] += entry.duration
-            if entry.details:
-                ticket_groups[entry.ticket]['details'].add(entry.details)
+"""]
+
+        # Ticket grouping happens in _aggregate_entries' single pass;
+        # this method only formats
+        ticket_groups = project_data['ticket_groups']
         
-        # Add each ticket section
+        # Add each ticket section. Plain sorted() with no key compares
+        # the tuples entirely in C, and a project rarely holds more than
+        # a handful of tickets within one week, so a full sort is cheap
         for ticket, ticket_data in sorted(ticket_groups.items()):
-            ticket_hours = ticket_data['total_time'] / 60
-            section += f"### {ticket}\n"
-            section += f"**Time spent:** {ticket_hours:.1f} hours  \n"
-            section += f"**Sessions:** {len(ticket_data['entries'])}\n\n"
-            
+            ticket_hours = ticket_data['total_time'] * _INV_60
+            parts.append(f"### {ticket}\n")
+            parts.append(f"**Time spent:** {ticket_hours:.1f} hours  \n")
+            parts.append(f"**Sessions:** {len(ticket_data['entries'])}\n\n")
+
             if ticket_data['details']:
-                section += "**Activities:**\n"
-                for detail in sorted(ticket_data['details']):
-                    section += f"- {detail}\n"
-                section += "\n"
-        
-        return section
+                parts.append("**Activities:**\n")
+                parts.extend(f"- {detail}\n" for detail in sorted(ticket_data['details']))
+                parts.append("\n")
+
+        return "".join(parts)
     
-    def _create_daily_breakdown(self, entries: List[WorkEntry]) -> str:
-        """Create daily breakdown section"""
-        # Group entries by day
-        daily_entries = {}
-        days_en = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        for entry in entries:
-            day_key = entry.timestamp.date()
-            if day_key not in daily_entries:
-                daily_entries[day_key] = []
-            daily_entries[day_key].append(entry)
-        
-        section = "## Daily Breakdown\n\n"
-        
-        # Sort days
-        for day in sorted(daily_entries.keys()):
-            day_name = days_en[day.weekday()]
-            day_entries = daily_entries[day]
-            day_hours = sum(entry.duration for entry in day_entries) / 60
-            
-            section += f"### {day_name} {day.strftime('%m/%d')}\n"
-            section += f"**Total:** {day_hours:.1f} hours\n\n"
-            
-            # Group by project for the day
-            day_projects = {}
-            for entry in day_entries:
-                if entry.project not in day_projects:
-                    day_projects[entry.project] = []
-                day_projects[entry.project].append(entry)
-            
-            for project, project_entries in day_projects.items():
-                project_hours = sum(entry.duration for entry in project_entries) / 60
-                tickets = set(entry.ticket for entry in project_entries)
-                
-                section += f"- **{project}** ({project_hours:.1f}h): {', '.join(tickets)}\n"
-            
-            section += "\n"
-        
-        return section
+    def _create_daily_breakdown(self, daily_entries: Dict[date, Dict[str, list]]) -> str:
+        """Create daily breakdown from day -> project -> [minutes, tickets]"""
+        parts = ["## Daily Breakdown\n\n"]
+
+        # Days come out in insertion order, which the aggregation pass
+        # guarantees is chronological - no re-sort needed (and a report
+        # covers at most 7 days anyway)
+        for day, day_projects in daily_entries.items():
+            day_hours = sum(v[0] for v in day_projects.values()) * _INV_60
+
+            # f-string date formatting avoids the strftime method call
+            parts.append(f"### {_DAYS_EN[day.weekday()]} {day:%m/%d}\n")
+            parts.append(f"**Total:** {day_hours:.1f} hours\n\n")
+
+            for project, (minutes, tickets) in day_projects.items():
+                parts.append(f"- **{project}** ({minutes * _INV_60:.1f}h): {', '.join(tickets)}\n")
+
+            parts.append("\n")
+
+        return "".join(parts)
     
     def get_report_path(self, date_str: str = None) -> Path:
         """Get path for report file"""
         if date_str:
             filename = f"weekly_report_{date_str}.md"
         else:
-            today = date.today()
-            week_start = today - timedelta(days=today.weekday())
-            week_end = week_start + timedelta(days=6)
+            week_start, week_end = _default_week_range()
             filename = f"weekly_report_{week_start.strftime('%Y%m%d')}-{week_end.strftime('%Y%m%d')}.md"
         
         return self.output_dir / filename
     
     def list_available_reports(self) -> List[str]:
         """List all available report files"""
-        if not self.output_dir.exists():
+        try:
+            dir_mtime = os.stat(self.output_dir).st_mtime_ns
+        except FileNotFoundError:
             return []
-        
+
+        if self._listing_cache is not None and self._listing_mtime == dir_mtime:
+            return self._listing_cache
+
         reports = []
-        for file_path in self.output_dir.glob("weekly_report_*.md"):
-            reports.append(str(file_path))
-        
-        return sorted(reports, reverse=True)  # Most recent first
+        with os.scandir(self.output_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("weekly_report_") and name.endswith(".md"):
+                    reports.append(entry.path)
+
+        reports.sort(reverse=True)  # Most recent first
+        self._listing_cache = reports
+        self._listing_mtime = dir_mtime
+        return reports
     
-    def get_available_weeks(self) -> List[dict]:
-        """Get list of available weeks with date ranges"""
-        if not self.output_dir.exists():
-            return []
-        
-        weeks = []
-        for file_path in self.output_dir.glob("weekly_report_*.md"):
-            # Extract date range from filename: weekly_report_20250825-20250831.md
-            filename = file_path.stem
-            if filename.startswith("weekly_report_"):
-                date_part = filename[14:]  # Remove "weekly_report_"
-                if "-" in date_part and len(date_part) == 17:  # YYYYMMDD-YYYYMMDD
-                    try:
-                        start_str, end_str = date_part.split("-")
-                        start_date = datetime.strptime(start_str, "%Y%m%d").date()
-                        end_date = datetime.strptime(end_str, "%Y%m%d").date()
-                        
-                        # Format for display: MM/DD/YYYY - MM/DD/YYYY
-                        display_range = f"{start_date.strftime('%m/%d/%Y')} - {end_date.strftime('%m/%d/%Y')}"
-                        
-                        weeks.append({
-                            'display': display_range,
-                            'file_path': str(file_path),
-                            'start_date': start_date,
-                            'end_date': end_date
-                        })
-                    except ValueError:
-                        continue  # Skip invalid filename formats
-        
-        # Sort by start date, most recent first
-        weeks.sort(key=lambda x: x['start_date'], reverse=True)
-        return weeks
+    def _iter_available_weeks(self) -> Iterator[dict]:
+        """Yield week dicts for every report on disk, unordered
+
+        os.scandir hands back DirEntry objects whose .name needs no
+        extra syscall or PurePath construction, unlike Path.glob. The
+        loop sticks to the plain strings DirEntry already carries
+        (entry.name, entry.path) - no Path objects are built per file.
+        """
+        try:
+            it = os.scandir(self.output_dir)
+        except FileNotFoundError:
+            return
+
+        with it:
+            for entry in it:
+                # Extract date range from filename: weekly_report_20250825-20250831.md
+                # (the compiled regex does the prefix/shape checks in one C match)
+                m = _REPORT_RE.match(entry.name)
+                if not m:
+                    continue
+                try:
+                    start_date = _parse_ymd(m.group(1))
+                    end_date = _parse_ymd(m.group(2))
+                except ValueError:
+                    continue  # Skip invalid filename formats
+
+                yield {
+                    # Format for display: MM/DD/YYYY - MM/DD/YYYY
+                    'display': f"{_fmt_mdy(start_date)} - {_fmt_mdy(end_date)}",
+                    'file_path': entry.path,
+                    'start_date': start_date,
+                    'end_date': end_date
+                }
+
+    def get_available_weeks(self, limit: int = None) -> List[dict]:
+        """Get list of available weeks with date ranges, most recent first
+
+        Args:
+            limit: Return only the N most recent weeks. A bounded heap
+                selection is O(N log k) versus a full O(N log N) sort.
+        """
+        key = itemgetter('start_date')
+        if limit:
+            return heapq.nlargest(limit, self._iter_available_weeks(), key=key)
+        return sorted(self._iter_available_weeks(), key=key, reverse=True)
     
     def generate_last_week_report(self, app_state: AppState) -> str:
         """Generate report for last week"""
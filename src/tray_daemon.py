@@ -3,8 +3,12 @@
 import gi
 import sys
 import os
+import logging
+import shutil
 import signal
-from datetime import datetime
+import time
+import weakref
+from functools import cached_property
 from typing import Optional
 import subprocess
 
@@ -25,6 +29,40 @@ except (ImportError, ValueError):
         gi.require_version('Notify', '0.7')
         from gi.repository import Notify, GLib
 
+# Module logger with a NullHandler: hot-path instrumentation is a
+# near-free isEnabledFor check until main() configures real output
+log = logging.getLogger("tray_daemon")
+log.addHandler(logging.NullHandler())
+
+# Menu labels as module constants: emoji-bearing literals are not
+# interned by CPython, so referencing one shared string beats
+# re-materializing them whenever menu parts are (re)built
+_LABEL_STATUS_STARTING = "📊 Status: Starting..."
+_LABEL_LOG_WORK = "📝 Log Work"
+_LABEL_GENERATE_REPORT = "📄 Generate Current Report"
+_LABEL_GENERATE_LAST_WEEK = "📅 Generate Last Week Report"
+_LABEL_VIEW_REPORTS = "📋 View Reports"
+_LABEL_VIEW_STATUS = "📊 View Status"
+_LABEL_CLEANUP = "🧹 Cleanup Test Data"
+_LABEL_QUIT = "🚪 Quit"
+_LABEL_OPEN_REPORTS_FOLDER = "📁 Open Reports Folder"
+_LABEL_NO_ACTIVE_WORK = "⏸️ No active work"
+
+# Weak reference to the (single) daemon instance for the shared
+# module-level signal callback - keeps the handler from pinning the
+# daemon alive and avoids allocating a per-instance closure
+_daemon_ref = None
+
+
+def _on_shutdown_signal():
+    """Shared SIGTERM/SIGINT callback, dispatched on the main loop"""
+    daemon = _daemon_ref() if _daemon_ref is not None else None
+    if daemon is not None:
+        print("\nReceived shutdown signal, shutting down...")
+        daemon.quit()
+    return False  # One-shot: the source is removed after quit
+
+
 from .data_manager import DataManager
 from .notification_manager import NotificationManager, HourlyTimer
 from .report_generator import ReportGenerator
@@ -35,25 +73,104 @@ class TrayWeeklyReportDaemon:
     """Weekly Report Daemon with system tray support"""
     
     def __init__(self):
-        self.data_manager = DataManager()
-        self.notification_manager = NotificationManager()
-        self.report_generator = ReportGenerator()
         self.indicator = None
         self.hourly_timer = None
-        
+        self.status_item = None  # Created with the menu when a tray exists
+        # Reports submenu cache key: directory mtime at last rebuild
+        # (None = never built, so the first open always populates)
+        self._reports_menu_mtime = None
+        # (monotonic timestamp, AppState) pair backing _state()
+        self._state_cache = (0.0, None)
+        # Resolve the report editor once - re-probing PATH (and paying
+        # a failed fork per missing candidate) on every open is wasted
+        self._editor = next(
+            (path for path in map(shutil.which, ("pluma", "gedit", "xdg-open"))
+             if path),
+            None
+        )
+
+        # Notification actions arrive on libnotify's D-Bus dispatch;
+        # wrap them once so the real handlers always run on the GTK
+        # main loop instead of racing it
+        self._continue_cb = self._dispatch_to_main_loop(self._on_continue_work)
+        self._stop_cb = self._dispatch_to_main_loop(self._on_stop_work)
+        self._details_cb = self._dispatch_to_main_loop(self._on_add_work_details)
+
         # Check for test mode
         self.test_mode = "--test" in sys.argv
         
+        global _daemon_ref
+        _daemon_ref = weakref.ref(self)
         self._setup_signal_handlers()
         
+    # The three managers are built on first use rather than in
+    # __init__: the database read, report-directory mkdir and the
+    # libnotify/D-Bus handshake all happen after the tray icon is up,
+    # not before
+    @cached_property
+    def data_manager(self):
+        return DataManager()
+
+    @cached_property
+    def notification_manager(self):
+        return NotificationManager()
+
+    @cached_property
+    def report_generator(self):
+        return ReportGenerator()
+
+    def _state(self):
+        """Get the app state, cached briefly within one user action
+
+        Menu and notification handlers each poke the state a few times
+        while servicing the same event; a short TTL collapses those
+        into a single DataManager read. Write paths invalidate first so
+        they always see (and produce) fresh state.
+        """
+        ts, state = self._state_cache
+        if state is not None and time.monotonic() - ts < 0.5:
+            return state
+        state = self.data_manager.get_state()
+        self._state_cache = (time.monotonic(), state)
+        return state
+
+    def _invalidate_state_cache(self):
+        self._state_cache = (0.0, None)
+
+    @staticmethod
+    def _dispatch_to_main_loop(fn):
+        """Defer a callback onto the GTK main loop via GLib.idle_add
+
+        Serializes notification-action work with everything else the
+        main loop runs, and coalesces a burst of queued actions into
+        ordinary idle dispatches instead of re-entrant calls.
+        """
+        def handler(*args):
+            def run():
+                fn(*args)
+                return False  # One-shot idle source
+            GLib.idle_add(run)
+        return handler
+
     def _setup_signal_handlers(self):
-        """Setup signal handlers"""
-        def handler(signum, frame):
-            print(f"\\nReceived signal {signum}, shutting down...")
-            self.quit()
-        
-        signal.signal(signal.SIGTERM, handler)
-        signal.signal(signal.SIGINT, handler)
+        """Install the single SIGTERM/SIGINT shutdown path
+
+        One shared handler covers both signals and runs the full
+        quit() sequence (timer stop, notification teardown, tray icon
+        removal, Gtk.main_quit) - the instance flock needs no explicit
+        release, the kernel drops it on exit.
+
+        Registered via GLib.unix_signal_add, which delivers on the main
+        loop through GLib's own signal source: a signal arriving while
+        Gtk.main() is blocked in poll() wakes it immediately, whereas a
+        Python signal.signal handler only runs between bytecodes and
+        can lag by a full poll timeout on an idle daemon. The callback
+        is the module-level _on_shutdown_signal, which reaches the
+        instance through a weakref rather than a bound closure.
+        """
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            GLib.unix_signal_add(GLib.PRIORITY_HIGH, signum,
+                                 _on_shutdown_signal)
     
     def start(self):
         """Start the daemon"""
@@ -65,17 +182,19 @@ class TrayWeeklyReportDaemon:
             print("⚠️  AppIndicator not available, running without system tray")
         
         self._setup_timer()
-        self._show_startup_notification()
+        # Defer the startup notification: it reads state from disk and
+        # does a D-Bus round-trip, so let the tray icon paint first and
+        # run it as a low-priority idle once the loop is up
+        GLib.idle_add(self._show_startup_notification,
+                      priority=GLib.PRIORITY_LOW)
         
         print("✅ Daemon started successfully")
         if self.indicator:
             print("📌 System tray icon should be visible in the notification area")
         
-        # Start GTK main loop
-        try:
-            Gtk.main()
-        except KeyboardInterrupt:
-            self.quit()
+        # Start GTK main loop; Ctrl-C arrives as a normal main-loop
+        # callback via the GLib signal source, not KeyboardInterrupt
+        Gtk.main()
     
     def _setup_system_tray(self):
         """Setup system tray icon"""
@@ -104,7 +223,7 @@ class TrayWeeklyReportDaemon:
         menu = Gtk.Menu()
         
         # Current status item
-        self.status_item = Gtk.MenuItem(label="📊 Status: Starting...")
+        self.status_item = Gtk.MenuItem(label=_LABEL_STATUS_STARTING)
         self.status_item.set_sensitive(False)
         menu.append(self.status_item)
         
@@ -112,29 +231,29 @@ class TrayWeeklyReportDaemon:
         menu.append(Gtk.SeparatorMenuItem())
         
         # Add work entry
-        add_work_item = Gtk.MenuItem(label="📝 Log Work")
+        add_work_item = Gtk.MenuItem(label=_LABEL_LOG_WORK)
         add_work_item.connect("activate", self._on_add_work)
         menu.append(add_work_item)
         
         # Generate current report
-        report_item = Gtk.MenuItem(label="📄 Generate Current Report")
+        report_item = Gtk.MenuItem(label=_LABEL_GENERATE_REPORT)
         report_item.connect("activate", self._on_generate_report)
         menu.append(report_item)
         
         # Generate last week report
-        last_week_item = Gtk.MenuItem(label="📅 Generate Last Week Report")
+        last_week_item = Gtk.MenuItem(label=_LABEL_GENERATE_LAST_WEEK)
         last_week_item.connect("activate", self._on_generate_last_week_report)
         menu.append(last_week_item)
         
-        # View Reports submenu
-        reports_submenu = self._create_reports_submenu()
-        if reports_submenu:
-            view_reports_item = Gtk.MenuItem(label="📋 View Reports")
-            view_reports_item.set_submenu(reports_submenu)
-            menu.append(view_reports_item)
+        # View Reports submenu, populated lazily when it is opened so
+        # startup skips the report-directory scan and new reports show
+        # up without restarting the daemon
+        view_reports_item = Gtk.MenuItem(label=_LABEL_VIEW_REPORTS)
+        view_reports_item.set_submenu(self._build_reports_submenu_skeleton())
+        menu.append(view_reports_item)
         
         # Show current status
-        current_item = Gtk.MenuItem(label="📊 View Status")
+        current_item = Gtk.MenuItem(label=_LABEL_VIEW_STATUS)
         current_item.connect("activate", self._on_show_status)
         menu.append(current_item)
         
@@ -142,7 +261,7 @@ class TrayWeeklyReportDaemon:
         menu.append(Gtk.SeparatorMenuItem())
         
         # Cleanup test data
-        cleanup_item = Gtk.MenuItem(label="🧹 Cleanup Test Data")
+        cleanup_item = Gtk.MenuItem(label=_LABEL_CLEANUP)
         cleanup_item.connect("activate", self._on_cleanup_test_data)
         menu.append(cleanup_item)
         
@@ -150,7 +269,7 @@ class TrayWeeklyReportDaemon:
         menu.append(Gtk.SeparatorMenuItem())
         
         # Quit
-        quit_item = Gtk.MenuItem(label="🚪 Quit")
+        quit_item = Gtk.MenuItem(label=_LABEL_QUIT)
         quit_item.connect("activate", self._on_quit)
         menu.append(quit_item)
         
@@ -177,53 +296,72 @@ class TrayWeeklyReportDaemon:
             self._update_tray_status(f"📝 {current_work}")
         else:
             message = "Ready to track work"
-            self._update_tray_status("⏸️ No active work")
+            self._update_tray_status(_LABEL_NO_ACTIVE_WORK)
         
         self.notification_manager.show_info_notification(
             "Weekly Report Tracker",
             f"Iniciado - {message}"
         )
+        return False  # One-shot idle callback
     
     def _on_timer_tick(self):
         """Called by timer"""
-        print(f"⏰ Timer tick at {datetime.now().strftime('%H:%M:%S')}")
+        # Debug-level and %-deferred: when debug logging is off the
+        # tick costs one level check, no strftime and no write syscall
+        log.debug("⏰ Timer tick")
         
         current_work = self._get_current_work()
         
         self.notification_manager.show_work_check_notification(
             current_work=current_work,
-            on_continue=self._on_continue_work,
-            on_stop=self._on_stop_work,
-            on_details=self._on_add_work_details
+            on_continue=self._continue_cb,
+            on_stop=self._stop_cb,
+            on_details=self._details_cb
         )
     
     def _on_continue_work(self, notification, action, user_data):
-        """Continue current work"""
-        state = self.data_manager.get_state()
-        
+        """Continue current work
+
+        Arrives via the idle dispatcher, so the whole happy-path batch
+        (DB write, success notification, tray label) runs inside one
+        main-loop iteration - no extra wakeup per step - and the
+        fallback dialog opens from the main loop, never the
+        notification thread.
+        """
+        self._invalidate_state_cache()
+        state = self._state()
+
         if state.current_ticket and state.current_project:
-            self.data_manager.add_work_entry(
-                state.current_ticket,
-                state.current_project,
-                state.current_details or ""
-            )
-            
-            work_desc = f"{state.current_project} - {state.current_ticket}"
-            self.notification_manager.show_success_notification(
-                f"✅ Time logged: {work_desc}"
-            )
-            self._update_tray_status(f"📝 {work_desc}")
+            self._log_continued_work(state)
         else:
             self._on_add_work(None)
+
+    def _log_continued_work(self, state):
+        """Record another session of the current work and reflect it"""
+        self.data_manager.add_work_entry(
+            state.current_ticket,
+            state.current_project,
+            state.current_details or ""
+        )
+        # add_work_entry mutates the same AppState in place; re-stamp
+        # the cache so follow-up handlers don't reload it
+        self._state_cache = (time.monotonic(), state)
+
+        work_desc = f"{state.current_project} - {state.current_ticket}"
+        self.notification_manager.show_success_notification(
+            f"✅ Time logged: {work_desc}"
+        )
+        self._update_tray_status(f"📝 {work_desc}")
     
     def _on_stop_work(self, notification, action, user_data):
         """Stop current work"""
+        self._invalidate_state_cache()
         self.data_manager.stop_current_work()
         self.notification_manager.show_info_notification(
             "⏸️ Work paused",
             "Status updated"
         )
-        self._update_tray_status("⏸️ No active work")
+        self._update_tray_status(_LABEL_NO_ACTIVE_WORK)
     
     def _on_add_work_details(self, notification, action, user_data):
         """Add work details"""
@@ -232,6 +370,7 @@ class TrayWeeklyReportDaemon:
     def _on_add_work(self, menuitem):
         """Add new work entry using real dialog"""
         def on_dialog_result(result):
+            self._invalidate_state_cache()
             if result:
                 try:
                     # Check if we can auto-detect project
@@ -266,7 +405,7 @@ class TrayWeeklyReportDaemon:
                 )
         
         # Get current work for pre-filling
-        state = self.data_manager.get_state()
+        state = self._state()
         current_ticket = state.current_ticket or ""
         current_project = state.current_project or ""
         
@@ -281,7 +420,7 @@ class TrayWeeklyReportDaemon:
     def _on_generate_report(self, menuitem):
         """Generate weekly report"""
         try:
-            state = self.data_manager.get_state()
+            state = self._state()
             report_path = self.report_generator.generate_weekly_report(state)
             
             # Open report with Pluma
@@ -299,7 +438,7 @@ class TrayWeeklyReportDaemon:
     def _on_generate_last_week_report(self, menuitem):
         """Generate last week report"""
         try:
-            state = self.data_manager.get_state()
+            state = self._state()
             report_path = self.report_generator.generate_last_week_report(state)
             
             # Open report with Pluma
@@ -315,43 +454,29 @@ class TrayWeeklyReportDaemon:
             )
     
     def _open_with_pluma(self, file_path):
-        """Open file with Pluma text editor (non-blocking)"""
+        """Open file with the pre-resolved editor (non-blocking)
+
+        GLib.spawn_async launches via posix_spawn where available
+        instead of forking the full GTK-loaded interpreter image the
+        way subprocess.Popen does, and GLib reaps the child for us.
+        """
+        if self._editor is None:
+            log.warning("❌ No suitable application found to open: %s", file_path)
+            return
         try:
-            # Try pluma first (non-blocking)
-            try:
-                subprocess.Popen(['pluma', file_path], 
-                               stdout=subprocess.DEVNULL, 
-                               stderr=subprocess.DEVNULL)
-                print(f"📄 Opened with pluma: {file_path}")
-                return
-            except FileNotFoundError:
-                pass
-            
-            # Fallback to gedit (non-blocking)
-            try:
-                subprocess.Popen(['gedit', file_path],
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
-                print(f"📄 Opened with gedit: {file_path}")
-                return
-            except FileNotFoundError:
-                pass
-            
-            # Final fallback to xdg-open (non-blocking)
-            try:
-                subprocess.Popen(['xdg-open', file_path],
-                               stdout=subprocess.DEVNULL,
-                               stderr=subprocess.DEVNULL)
-                print(f"📄 Opened with default application: {file_path}")
-            except FileNotFoundError:
-                print(f"❌ No suitable application found to open: {file_path}")
-                
+            GLib.spawn_async(
+                [self._editor, file_path],
+                flags=(GLib.SpawnFlags.STDOUT_TO_DEV_NULL |
+                       GLib.SpawnFlags.STDERR_TO_DEV_NULL)
+            )
+            log.info("📄 Opened with %s: %s",
+                     os.path.basename(self._editor), file_path)
         except Exception as e:
-            print(f"❌ Error opening file: {e}")
+            log.error("❌ Error opening file: %s", e)
     
     def _on_show_status(self, menuitem):
         """Show current status"""
-        state = self.data_manager.get_state()
+        state = self._state()
         current_work = self._get_current_work()
         
         if current_work:
@@ -367,31 +492,64 @@ class TrayWeeklyReportDaemon:
         
         self.notification_manager.show_info_notification("📊 Current Status", message)
     
-    def _create_reports_submenu(self):
-        """Create submenu with available weekly reports"""
-        weeks = self.report_generator.get_available_weeks()
-        if not weeks:
-            return None
-        
-        submenu = Gtk.Menu()
-        
+    def _build_reports_submenu_skeleton(self):
+        """Create the reports submenu's static chrome exactly once
+
+        The trailing separator and "Open Reports Folder" item never
+        change; only the week items above them are dynamic, and those
+        are maintained in place by _on_reports_submenu_show.
+        """
+        self._reports_submenu = Gtk.Menu()
+        self._reports_submenu.connect("show", self._on_reports_submenu_show)
+        self._reports_submenu.append(Gtk.SeparatorMenuItem())
+
+        more_item = Gtk.MenuItem(label=_LABEL_OPEN_REPORTS_FOLDER)
+        more_item.connect("activate", self._on_open_reports_folder)
+        self._reports_submenu.append(more_item)
+
+        self._reports_submenu.show_all()
+        self._week_items = []
+        return self._reports_submenu
+
+    def _on_reports_submenu_show(self, submenu):
+        """Refresh the dynamic week items when the submenu is shown
+
+        Keyed on the report directory's mtime: reopening the menu with
+        no new reports skips both the rescan and the widget churn.
+        Existing MenuItems are relabelled in place; widgets are only
+        allocated on growth and removed on shrink.
+        """
+        try:
+            dir_mtime = os.stat(self.report_generator.output_dir).st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = -1
+
+        if dir_mtime == self._reports_menu_mtime:
+            return
+        self._reports_menu_mtime = dir_mtime
+
         # Limit to last 10 weeks to avoid too long menu
-        for week in weeks[:10]:
-            week_item = Gtk.MenuItem(label=week['display'])
-            week_item.connect("activate", lambda item, path=week['file_path']: self._open_report(path))
-            submenu.append(week_item)
-        
-        # If there are more than 10 weeks, add "More..." option
-        if len(weeks) > 10:
-            separator = Gtk.SeparatorMenuItem()
-            submenu.append(separator)
-            
-            more_item = Gtk.MenuItem(label="📁 Open Reports Folder")
-            more_item.connect("activate", self._on_open_reports_folder)
-            submenu.append(more_item)
-        
-        submenu.show_all()
-        return submenu
+        weeks = self.report_generator.get_available_weeks(limit=10)
+
+        items = self._week_items
+        for i, week in enumerate(weeks):
+            if i < len(items):
+                item = items[i]
+                item.set_label(week['display'])
+            else:
+                item = Gtk.MenuItem(label=week['display'])
+                item.connect("activate", self._on_week_item_activate)
+                submenu.insert(item, i)
+                item.show()
+                items.append(item)
+            item.report_path = week['file_path']
+
+        while len(items) > len(weeks):
+            submenu.remove(items.pop())
+
+    def _on_week_item_activate(self, item):
+        """Open the report attached to a week item"""
+        self._open_report(item.report_path)
     
     def _open_report(self, report_path):
         """Open specific report file"""
@@ -402,10 +560,19 @@ class TrayWeeklyReportDaemon:
         )
     
     def _on_open_reports_folder(self, menuitem):
-        """Open reports folder in file manager"""
+        """Open reports folder in file manager (non-blocking)"""
         try:
             reports_dir = str(self.report_generator.output_dir)
-            subprocess.run(['xdg-open', reports_dir], check=False)
+            try:
+                # Gio resolves the default handler in-process - no fork,
+                # and unlike subprocess.run it returns immediately
+                # instead of blocking the main loop while the file
+                # manager starts
+                from gi.repository import Gio
+                Gio.AppInfo.launch_default_for_uri(
+                    GLib.filename_to_uri(reports_dir, None), None)
+            except Exception:
+                subprocess.Popen(['xdg-open', reports_dir])
             self.notification_manager.show_info_notification(
                 "📁 Reports folder opened",
                 f"Location: {reports_dir}"
@@ -418,6 +585,7 @@ class TrayWeeklyReportDaemon:
     def _on_cleanup_test_data(self, menuitem):
         """Cleanup test/demo data"""
         try:
+            self._invalidate_state_cache()
             removed_count = self.data_manager.cleanup_test_data()
             
             if removed_count > 0:
@@ -442,14 +610,16 @@ class TrayWeeklyReportDaemon:
     
     def _get_current_work(self) -> Optional[str]:
         """Get current work description"""
-        state = self.data_manager.get_state()
+        state = self._state()
         if state.current_ticket and state.current_project:
             return f"{state.current_project} - {state.current_ticket}"
         return None
     
     def _update_tray_status(self, status_text: str):
         """Update tray menu status"""
-        if self.indicator and hasattr(self, 'status_item'):
+        # Plain None checks - hasattr() probes via a swallowed
+        # AttributeError, needless on this every-tick path
+        if self.indicator is not None and self.status_item is not None:
             self.status_item.set_label(status_text)
     
     def cleanup(self):
@@ -479,99 +649,69 @@ class TrayWeeklyReportDaemon:
         Gtk.main_quit()
 
 
-def cleanup_stale_locks():
-    """Clean up stale lock files from previous runs"""
-    lock_files = [
-        "/tmp/weekly-report-tray.lock",
-        "/tmp/weekly-report-tracker.lock",
-        "/tmp/weekly-report-tracker-working.lock"
-    ]
-    
-    for lock_file in lock_files:
-        if os.path.exists(lock_file):
-            try:
-                with open(lock_file, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                # Check if process is actually running
-                try:
-                    os.kill(pid, 0)  # Signal 0 just checks if process exists
-                    # Process exists, this is a real running instance
-                    return False, f"Process {pid} is running (lock: {lock_file})"
-                except ProcessLookupError:
-                    # Process doesn't exist, remove stale lock file
-                    os.remove(lock_file)
-                    print(f"🧹 Removed stale lock file: {lock_file}")
-                except PermissionError:
-                    # Can't check process (different user), assume it's running
-                    return False, f"Cannot verify process {pid} (permission denied)"
-                    
-            except (ValueError, FileNotFoundError):
-                # Invalid or missing lock file, remove it
-                try:
-                    os.remove(lock_file)
-                    print(f"🧹 Removed invalid lock file: {lock_file}")
-                except FileNotFoundError:
-                    pass
-    
-    return True, "All stale locks cleaned"
+# Held for the daemon's whole lifetime; the kernel drops the flock
+# automatically when the process dies, so there is no stale state to
+# clean up and no atexit handler to register
+_lock_fd = None
+
+
+def acquire_instance_lock(lock_file):
+    """Try to become the single running instance
+
+    An exclusive flock on a long-lived fd replaces the old read-PID /
+    kill(pid, 0) / remove / recreate dance, which left a window where
+    two daemons starting together could both pass the check. The lock
+    is released by the kernel on exit (including crashes), so stale
+    lock files can never block a restart.
+    """
+    global _lock_fd
+    import fcntl
+
+    fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return False
+
+    # Record our PID for tooling (check_status shows and signals it)
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _lock_fd = fd
+    return True
 
-def setup_cleanup_handlers(lock_file):
-    """Setup cleanup handlers for graceful shutdown"""
-    def cleanup_lock_file():
-        try:
-            if os.path.exists(lock_file):
-                os.remove(lock_file)
-                print(f"🧹 Cleaned up lock file: {lock_file}")
-        except Exception as e:
-            print(f"⚠️  Error cleaning lock file: {e}")
-    
-    # Register cleanup for normal exit
-    import atexit
-    atexit.register(cleanup_lock_file)
-    
-    # Setup signal handlers for graceful shutdown
-    def signal_cleanup(signum, frame):
-        print(f"\n📡 Received signal {signum}, cleaning up...")
-        cleanup_lock_file()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGTERM, signal_cleanup)
-    signal.signal(signal.SIGINT, signal_cleanup)
 
 def main():
     """Main entry point with improved lock management"""
     lock_file = "/tmp/weekly-report-tray.lock"
-    
+
+    # When stdout is a pipe or file (daemon under a supervisor) Python
+    # block-buffers it and startup messages only appear at exit; force
+    # line buffering once instead of sprinkling flushes
+    try:
+        sys.stdout.reconfigure(line_buffering=True)
+        sys.stderr.reconfigure(line_buffering=True)
+    except (AttributeError, ValueError):
+        pass  # Non-reconfigurable streams (already detached/replaced)
+
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get('TRAY_DEBUG') else logging.INFO,
+        format='%(asctime)s %(name)s: %(message)s'
+    )
+
     try:
-        # First, clean up any stale lock files
         print("🔍 Checking for existing instances...")
-        can_start, message = cleanup_stale_locks()
-        
-        if not can_start:
-            print(f"❌ Cannot start: {message}")
-            return 1
-        
-        print("✅ No running instances found")
-        
-        # Try to create our lock file
-        try:
-            with open(lock_file, 'x') as f:
-                f.write(str(os.getpid()))
-            print(f"🔒 Created lock file: {lock_file}")
-        except FileExistsError:
-            # This shouldn't happen after cleanup, but just in case
-            print("❌ Lock file appeared after cleanup - another instance started simultaneously")
+        if not acquire_instance_lock(lock_file):
+            print(f"❌ Cannot start: another instance holds {lock_file}")
             return 1
-        
-        # Setup cleanup handlers
-        setup_cleanup_handlers(lock_file)
-        
+
+        print(f"🔒 Acquired instance lock: {lock_file}")
+
         # Create and start daemon
         daemon = TrayWeeklyReportDaemon()
         daemon.start()
         return 0
-        
+
     except KeyboardInterrupt:
         print("\n🛑 Interrupted by user")
         return 0
@@ -4,7 +4,33 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GLib
 from typing import Optional, Callable
-import threading
+import sys
+from bisect import bisect_left
+from itertools import islice
+
+# Dropdown rows beyond this render measurably slowly (one cell-renderer
+# pass per item); older tickets stay reachable through the completion
+_MAX_DROPDOWN_TICKETS = 100
+
+# Quiescence window before ticket auto-detect runs - long enough to
+# coalesce a typing burst into one lookup, short enough to feel live
+_AUTODETECT_DEBOUNCE_MS = 150
+
+# Hint markup built once - set_markup reparses Pango markup every call,
+# so static strings are precomposed and dynamic ones change-gated
+_HINT_AUTOFILLED = "<small><span color='green'>✅ Auto-filled from existing ticket</span></small>"
+_HINT_AUTODETECTED = "<small><span color='green'>✅ Auto-detected: {}</span></small>"
+_HINT_NEW_PROJECT = "<small><i>New project for: {}</i></small>"
+
+# Ticket models shared across dialog opens. The ticket set changes only
+# on writes, which DataManager counts in state_version - dialogs reuse
+# the stores and the sorted lowercase list until that counter moves.
+_TICKET_MODEL_CACHE = {
+    'version': -1,
+    'store': None,       # Capped recency dropdown model
+    'full_store': None,  # Full set backing the completion
+    'lc_sorted': None,   # Sorted lowercase tickets for prefix bisect
+}
 
 
 class WorkEntryDialog:
@@ -16,27 +42,22 @@ class WorkEntryDialog:
         self.dialog = None
         self.current_ticket = current_ticket
         self.current_project = current_project
-        
-        # Get existing tickets for combobox
-        self.existing_tickets = self._get_existing_tickets()
-        
-        # Create dialog in main thread
-        GLib.idle_add(self._create_dialog)
-    
-    def _get_existing_tickets(self):
-        """Get list of existing tickets from work entries"""
-        state = self.data_manager.get_state()
-        tickets = {}
-        
-        for entry in state.work_entries:
-            if entry.ticket not in tickets:
-                tickets[entry.ticket] = {
-                    'project': entry.project,
-                    'last_details': entry.details
-                }
-        
-        return tickets
-    
+        self._ticket_debounce_id = 0
+        self._last_hint = ""
+        self._signal_ids = []
+
+        # Existing tickets for the combobox: a flat snapshot of
+        # ticket -> (project, last_details) tuples the data manager
+        # keeps current, so opening a dialog costs no history scan and
+        # no state-object traversal on the UI thread
+        self.existing_tickets = data_manager.get_ticket_index()
+
+        # Create dialog in main thread. DEFAULT_IDLE outranks the
+        # PRIORITY_LOW source run_async queues, so the main loop always
+        # runs creation before show-and-wait without any handshake.
+        GLib.idle_add(self._create_dialog,
+                      priority=GLib.PRIORITY_DEFAULT_IDLE)
+
     def _create_dialog(self):
         """Create work entry dialog"""
         self.dialog = Gtk.Dialog(
@@ -56,6 +77,12 @@ class WorkEntryDialog:
         content_area = self.dialog.get_content_area()
         content_area.set_border_width(20)
         content_area.set_spacing(15)
+
+        # Hold back child-property notifications while the ~12 widgets
+        # below are packed; one layout pass at show_all instead of a
+        # size-allocate cascade per pack_start
+        self.dialog.freeze_child_notify()
+        content_area.freeze_child_notify()
         
         # Header
         header = Gtk.Label()
@@ -68,14 +95,44 @@ class WorkEntryDialog:
         ticket_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
         ticket_box.set_border_width(10)
         
-        # Create combobox with text entry capability
-        self.ticket_combo = Gtk.ComboBoxText.new_with_entry()
+        # Create combobox with text entry capability. The models are
+        # filled before they are attached so GTK emits no row-inserted
+        # signals or relayouts per ticket, and they are cached at module
+        # scope: dialogs open far more often than the ticket set changes,
+        # so an unchanged state_version reuses the built stores outright.
+        cache = _TICKET_MODEL_CACHE
+        if cache['version'] != self.data_manager.state_version:
+            # Dropdown: only the most recent tickets - the index keeps
+            # keys in last-use order, so reversed() yields freshest first
+            store = Gtk.ListStore(str)
+            recent = islice(reversed(self.existing_tickets), _MAX_DROPDOWN_TICKETS)
+            for ticket in recent:
+                store.insert_with_valuesv(-1, [0], [ticket])
+
+            # Completion: the full set, plus the sorted lowercase list
+            # that backs the prefix bisect in _match_ticket_prefix
+            full_store = Gtk.ListStore(str)
+            for ticket in self.existing_tickets:
+                full_store.insert_with_valuesv(-1, [0], [ticket])
+
+            cache['version'] = self.data_manager.state_version
+            cache['store'] = store
+            cache['full_store'] = full_store
+            cache['lc_sorted'] = sorted(t.lower() for t in self.existing_tickets)
+
+        self.ticket_combo = Gtk.ComboBox.new_with_model_and_entry(cache['store'])
         self.ticket_combo.set_entry_text_column(0)
-        
-        # Add existing tickets to combobox
-        for ticket in sorted(self.existing_tickets.keys()):
-            self.ticket_combo.append_text(ticket)
-        
+
+        self._tickets_lc_sorted = cache['lc_sorted']
+        self._match_key = None
+        self._match_set = frozenset()
+        completion = Gtk.EntryCompletion()
+        completion.set_model(cache['full_store'])
+        completion.set_text_column(0)
+        completion.set_match_func(self._match_ticket_prefix, None)
+        completion.set_minimum_key_length(2)
+        self.ticket_combo.get_child().set_completion(completion)
+
         # Set current ticket if provided
         if self.current_ticket:
             self.ticket_combo.get_child().set_text(self.current_ticket)
@@ -105,84 +162,123 @@ class WorkEntryDialog:
         project_frame.add(project_box)
         content_area.pack_start(project_frame, False, False, 0)
         
-        # Details entry
+        # Details entry. Most entries never get details, so the
+        # ScrolledWindow + TextView + buffer machinery is deferred: a
+        # click on the placeholder label materializes the real editor.
         details_frame = Gtk.Frame(label="📋 Details (optional)")
-        details_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        details_box.set_border_width(10)
+        self._details_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
+        self._details_box.set_border_width(10)
+
+        self.placeholder_text = "Describe what you're working on: implementation, testing, debugging, meeting..."
+        self.showing_placeholder = False
+        self._details_is_empty = True
+        self.details_textview = None
+
+        placeholder_label = Gtk.Label()
+        placeholder_label.set_markup(
+            f"<span color='gray'><i>{self.placeholder_text}</i></span>")
+        placeholder_label.set_halign(Gtk.Align.START)
+        placeholder_label.set_line_wrap(True)
+        self._details_placeholder_box = Gtk.EventBox()
+        self._details_placeholder_box.add(placeholder_label)
+
+        self._details_box.pack_start(self._details_placeholder_box, True, True, 0)
+        details_frame.add(self._details_box)
+        content_area.pack_start(details_frame, True, True, 0)
+
+        # Connect signals - bound methods throughout (no lambda
+        # wrappers), with every handler id kept so teardown can
+        # disconnect before destroy and avoid stray emissions
+        ticket_entry = self.ticket_combo.get_child()
+        self._signal_ids = [
+            (self.ticket_combo,
+             self.ticket_combo.connect("changed", self._on_ticket_changed)),
+            (ticket_entry,
+             ticket_entry.connect("changed", self._on_ticket_text_changed)),
+            (self._details_placeholder_box,
+             self._details_placeholder_box.connect(
+                 "button-press-event", self._on_details_placeholder_clicked)),
+        ]
         
+        # Focus on ticket entry
+        self.ticket_combo.grab_focus()
+
+        content_area.thaw_child_notify()
+        self.dialog.thaw_child_notify()
+        content_area.show_all()
+        return False
+    
+    def _on_details_placeholder_clicked(self, eventbox, event):
+        """First interaction with the details area - build the real editor"""
+        self._materialize_details_textview()
+        return True
+
+    def _materialize_details_textview(self):
+        """Swap the placeholder label for the actual TextView, focused
+
+        Runs at most once per dialog; until then the dialog carries no
+        TextView, buffer, or tag table for the (usually empty) details.
+        """
+        if self.details_textview is not None:
+            return
+
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_min_content_height(80)
         scrolled.set_shadow_type(Gtk.ShadowType.IN)
-        
+
         self.details_textview = Gtk.TextView()
         self.details_textview.set_wrap_mode(Gtk.WrapMode.WORD)
         self.details_textview.set_left_margin(8)
         self.details_textview.set_right_margin(8)
-        
-        # Start with empty details - use placeholder attribute instead
+
         buffer = self.details_textview.get_buffer()
-        buffer.set_text("")  # Always start empty
-        
-        # Add placeholder text using buffer tags for better UX
-        self._setup_placeholder_text()
-        
+
+        # Created once per buffer; applying it later is a tag-table-free
+        # operation instead of a lookup-or-create on every placeholder show
+        self._placeholder_tag = buffer.create_tag(
+            "placeholder", foreground="gray", style="italic")
+
         scrolled.add(self.details_textview)
-        details_box.pack_start(scrolled, True, True, 0)
-        details_frame.add(details_box)
-        content_area.pack_start(details_frame, True, True, 0)
-        
-        # Connect signals
-        self.ticket_combo.connect("changed", self._on_ticket_changed)
-        self.ticket_combo.get_child().connect("changed", self._on_ticket_text_changed)
-        
-        # Connect focus events for placeholder text
-        self.details_textview.connect("focus-in-event", self._on_details_focus_in)
-        self.details_textview.connect("focus-out-event", self._on_details_focus_out)
-        buffer.connect("changed", self._on_details_changed)
-        
-        # Focus on ticket entry
-        self.ticket_combo.grab_focus()
-        
-        content_area.show_all()
-        return False
-    
-    def _setup_placeholder_text(self):
-        """Setup placeholder text for details field"""
-        self.placeholder_text = "Describe what you're working on: implementation, testing, debugging, meeting..."
-        self.showing_placeholder = False
-        self._update_placeholder_visibility()
-    
+        self._details_box.remove(self._details_placeholder_box)
+        self._details_box.pack_start(scrolled, True, True, 0)
+        scrolled.show_all()
+
+        self._signal_ids += [
+            # Focus events for placeholder text
+            (self.details_textview,
+             self.details_textview.connect("focus-in-event", self._on_details_focus_in)),
+            (self.details_textview,
+             self.details_textview.connect("focus-out-event", self._on_details_focus_out)),
+            (buffer, buffer.connect("changed", self._on_details_changed)),
+        ]
+        self.details_textview.grab_focus()
+
     def _update_placeholder_visibility(self):
         """Update placeholder text visibility based on content"""
-        buffer = self.details_textview.get_buffer()
-        text = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), False)
-        
-        if not text.strip():
+        if self.showing_placeholder and self._details_is_empty:
+            # Steady state - the placeholder is already on screen, so a
+            # repeated focus-out must not force a set_text + retag
+            # (each one costs a full TextView relayout)
+            return
+
+        if self._details_is_empty:
             # Show placeholder
             self.showing_placeholder = True
+            buffer = self.details_textview.get_buffer()
             buffer.set_text(self.placeholder_text)
             # Make text look like placeholder (gray)
-            buffer.apply_tag(self._get_placeholder_tag(), 
-                           buffer.get_start_iter(), 
+            buffer.apply_tag(self._placeholder_tag,
+                           buffer.get_start_iter(),
                            buffer.get_end_iter())
-        else:
-            self.showing_placeholder = False
-    
-    def _get_placeholder_tag(self):
-        """Get or create placeholder text tag"""
-        buffer = self.details_textview.get_buffer()
-        tag = buffer.get_tag_table().lookup("placeholder")
-        if not tag:
-            tag = buffer.create_tag("placeholder", foreground="gray", style="italic")
-        return tag
-    
+
     def _on_details_focus_in(self, textview, event):
         """Handle focus in - remove placeholder if showing"""
         if self.showing_placeholder:
             buffer = textview.get_buffer()
             buffer.set_text("")
             self.showing_placeholder = False
+            self._details_is_empty = True
         return False
     
     def _on_details_focus_out(self, textview, event):
@@ -194,90 +290,153 @@ class WorkEntryDialog:
         """Handle text changes in details field"""
         if self.showing_placeholder:
             return  # Don't process changes while showing placeholder
-        
-        text = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), False)
-        if not text.strip() and not self.showing_placeholder:
-            # Text was cleared, will show placeholder on focus out
-            pass
+
+        # get_char_count() is O(1) on the buffer's btree - no need to
+        # materialize the whole text per keystroke just to test emptiness
+        self._details_is_empty = buffer.get_char_count() == 0
     
+    def _match_ticket_prefix(self, completion, key, tree_iter, user_data):
+        """Completion match: bisect the sorted lowercase ticket list
+
+        GTK calls this once per model row per keystroke. The prefix
+        range is computed once per distinct key (O(log n)) and cached as
+        a set, so the per-row work is a single membership test.
+        """
+        if key != self._match_key:
+            self._match_key = key
+            lo = bisect_left(self._tickets_lc_sorted, key)
+            hi = bisect_left(self._tickets_lc_sorted, key + '\uffff', lo)
+            self._match_set = frozenset(self._tickets_lc_sorted[lo:hi])
+        return completion.get_model()[tree_iter][0].lower() in self._match_set
+
     def _on_ticket_changed(self, combo):
         """Handle ticket selection from combobox"""
-        active_text = combo.get_active_text()
+        active_iter = combo.get_active_iter()
+        if active_iter is None:
+            return  # Text edit in the entry, not a dropdown selection
+        active_text = combo.get_model()[active_iter][0]
         if active_text and active_text in self.existing_tickets:
             # Auto-fill project from existing ticket
-            existing_data = self.existing_tickets[active_text]
-            self.project_entry.set_text(existing_data['project'])
-            self.project_hint.set_markup(f"<small><span color='green'>✅ Auto-filled from existing ticket</span></small>")
+            project, _last_details = self.existing_tickets[active_text]
+            self.project_entry.set_text(project)
+            self._set_hint(_HINT_AUTOFILLED)
             
             # Do NOT auto-fill details - keep empty for new entry
             # User specifically requested details to always be empty
-            buffer = self.details_textview.get_buffer()
-            buffer.set_text("")  # Always start empty
-            self._update_placeholder_visibility()
+            if self.details_textview is not None:
+                buffer = self.details_textview.get_buffer()
+                buffer.set_text("")  # Always start empty
+                self.showing_placeholder = False
+                self._details_is_empty = True
+                self._update_placeholder_visibility()
     
     def _on_ticket_text_changed(self, entry):
-        """Handle manual ticket text entry"""
-        ticket = entry.get_text().strip()
+        """Handle manual ticket text entry - debounce the auto-detect
+
+        Rapid typing fires this per keystroke; only the value that
+        survives the quiescence window is worth a project lookup.
+        """
+        # get_text_length is a C-side counter - gate on it before
+        # get_text materializes a fresh Python string for input that is
+        # too short to auto-detect anyway
+        if entry.get_text_length() < 3:
+            return
+        if self._ticket_debounce_id:
+            GLib.source_remove(self._ticket_debounce_id)
+        self._ticket_debounce_id = GLib.timeout_add(
+            _AUTODETECT_DEBOUNCE_MS, self._do_ticket_autodetect,
+            entry.get_text().strip())
+
+    def _do_ticket_autodetect(self, ticket):
+        """Look up/auto-fill the project once the ticket text has settled"""
+        self._ticket_debounce_id = 0
         if ticket and len(ticket) > 2:
+            # The index keys are interned; an interned probe makes the
+            # dict hits below pointer-equality comparisons (bounded so
+            # pathological paste-ins don't bloat the intern table)
+            if len(ticket) < 32:
+                ticket = sys.intern(ticket)
             # Try to auto-detect project
             auto_project = self.data_manager.get_project_for_ticket(ticket)
             if auto_project and not self.project_entry.get_text():
                 self.project_entry.set_text(auto_project)
-                self.project_hint.set_markup(f"<small><span color='green'>✅ Auto-detected: {auto_project}</span></small>")
+                self._set_hint(_HINT_AUTODETECTED.format(auto_project))
             elif ticket not in self.existing_tickets:
-                # Show hint for new ticket
-                prefix = ticket.split('-')[0] if '-' in ticket else ticket[:3].upper()
-                self.project_hint.set_markup(f"<small><i>New project for: {prefix}</i></small>")
+                # Show hint for new ticket. find() is one C-level scan
+                # returning -1 on miss - no list allocation like split,
+                # no second scan like a separate 'in' test
+                dash = ticket.find('-')
+                prefix = ticket[:dash] if dash > 0 else ticket[:3].upper()
+                self._set_hint(_HINT_NEW_PROJECT.format(prefix))
+        return False  # One-shot timeout
+
+    def _set_hint(self, markup):
+        """Update the project hint label, skipping redundant markup parses"""
+        if markup != self._last_hint:
+            self._last_hint = markup
+            self.project_hint.set_markup(markup)
     
     def run_async(self, callback: Callable):
-        """Run dialog asynchronously and call callback with result"""
-        def dialog_thread():
-            # Wait for dialog to be created
-            while self.dialog is None:
-                GLib.usleep(10000)  # 10ms
-            
-            GLib.idle_add(self._show_and_wait, callback)
-        
-        thread = threading.Thread(target=dialog_thread, daemon=True)
-        thread.start()
+        """Run dialog asynchronously and call callback with result
+
+        Queued at PRIORITY_LOW: the creation idle from __init__ runs at
+        the higher DEFAULT_IDLE priority, so the main loop sequences
+        create -> show on its own with no handshake or polling.
+        """
+        GLib.idle_add(self._show_and_wait, callback,
+                      priority=GLib.PRIORITY_LOW)
     
     def _show_and_wait(self, callback):
-        """Show dialog and handle response"""
-        response = self.dialog.run()
-        
+        """Show dialog and handle response
+
+        Validation failures re-run the same dialog - the user's input
+        stays put and nothing is destroyed or rebuilt for a typo.
+        """
         result = None
-        if response == Gtk.ResponseType.OK:
+        while True:
+            response = self.dialog.run()
+            if response != Gtk.ResponseType.OK:
+                break
+
             ticket = self.ticket_combo.get_child().get_text().strip()
             project = self.project_entry.get_text().strip()
-            
+
             if ticket and project:
-                # Get details from text view
-                buffer = self.details_textview.get_buffer()
-                start_iter = buffer.get_start_iter()
-                end_iter = buffer.get_end_iter()
-                details = buffer.get_text(start_iter, end_iter, False).strip()
-                
-                # Don't save placeholder text
-                if self.showing_placeholder or details == self.placeholder_text:
+                # A never-materialized TextView or a visible placeholder
+                # both mean no real input - don't copy a buffer out just
+                # to find the placeholder string and throw it away
+                if self.details_textview is None or self.showing_placeholder:
                     details = ""
-                
+                else:
+                    buffer = self.details_textview.get_buffer()
+                    start_iter = buffer.get_start_iter()
+                    end_iter = buffer.get_end_iter()
+                    details = buffer.get_text(start_iter, end_iter, False).strip()
+
                 result = {
                     'ticket': ticket,
                     'project': project,
                     'details': details
                 }
-            else:
-                # Show error and try again
-                self._show_error("❌ Error: Ticket and Project are required fields")
-                self.dialog.destroy()
-                GLib.idle_add(self._create_dialog)
-                GLib.timeout_add(100, lambda: self._show_and_wait(callback))
-                return False
-        
+                break
+
+            # Show error and re-enter the run loop on the live dialog
+            self._show_error("❌ Error: Ticket and Project are required fields")
+
+        self._disconnect_signals()
         self.dialog.destroy()
         callback(result)
         return False
     
+    def _disconnect_signals(self):
+        """Detach all handlers so widget teardown cannot re-enter them"""
+        if self._ticket_debounce_id:
+            GLib.source_remove(self._ticket_debounce_id)
+            self._ticket_debounce_id = 0
+        for widget, handler_id in self._signal_ids:
+            widget.disconnect(handler_id)
+        self._signal_ids = []
+
     def _show_error(self, message):
         """Show error message"""
         error_dialog = Gtk.MessageDialog(